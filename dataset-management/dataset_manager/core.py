@@ -39,6 +39,7 @@ class DatasetManagerCore:
         self.api_host = api_host
         self.dry_run = dry_run
         self._datasets_cache: Optional[List[Dict]] = None
+        self._datasets_by_name: Optional[Dict[str, Dict]] = None
 
     def _log_dry_run(self, message: str) -> None:
         """Log a dry-run message."""
@@ -138,6 +139,7 @@ class DatasetManagerCore:
 
         logger.info(f"Fetched {len(datasets)} datasets total")
         self._datasets_cache = datasets
+        self._datasets_by_name = None
         return datasets
 
     def find_dataset_by_name(self, name: str) -> Optional[Dict]:
@@ -152,9 +154,16 @@ class DatasetManagerCore:
         """
         datasets = self.fetch_all_datasets()
 
-        for ds in datasets:
-            if ds.get("content", {}).get("name") == name:
-                return ds
+        # Index by name once per fetched listing (first match wins)
+        if self._datasets_by_name is None:
+            by_name: Dict[str, Dict] = {}
+            for ds in datasets:
+                by_name.setdefault(ds.get("content", {}).get("name"), ds)
+            self._datasets_by_name = by_name
+
+        ds = self._datasets_by_name.get(name)
+        if ds is not None:
+            return ds
 
         logger.warning(f"Dataset not found: {name}")
         return None
@@ -56,13 +56,23 @@ Example config file (population_config.json):
 import argparse
 import csv
 import io
+import itertools
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
 
 # Set up import paths
 _this_dir = Path(__file__).parent
@@ -75,6 +85,183 @@ from shared.helpers import load_data, save_data
 
 API2_BASE_URL = "https://api2.pennsieve.io"
 
+# Concurrent source file downloads per dataset
+MAX_DOWNLOAD_WORKERS = 8
+
+# Datasets requested per page, and concurrent page requests after the first
+DATASETS_PAGE_SIZE = 500
+MAX_PAGE_WORKERS = 4
+
+# Records sent per POST, and concurrent record POSTs
+RECORDS_BATCH_SIZE = 1000
+MAX_POST_WORKERS = 4
+
+# Datasets populated concurrently by default
+MAX_DATASET_WORKERS = 4
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode("utf-8")
+
+
+def _loads(data: Any) -> Any:
+    """Parse JSON from str or bytes, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# (source_properties, constants) from ModelPopulator.compile_record_plan()
+RecordPlan = Tuple[List[Tuple[str, str, str, Callable[[Any], Any]]], Dict[str, Any]]
+
+# Sentinel returned by enum lookups when the value matches no enum entry
+_NO_MATCH = object()
+
+
+def _build_enum_lookup(enum: List[Any]) -> Callable[[Any], Any]:
+    """
+    Build an exact-then-case-insensitive matcher for an enum.
+
+    Returns a function that maps a value to its canonical enum entry,
+    or _NO_MATCH if the value isn't in the enum.
+    """
+    try:
+        enum_set = frozenset(enum)
+    except TypeError:
+        enum_set = tuple(enum)
+
+    # First enum entry wins when several share the same lowercase form
+    enum_lower_map: Dict[str, Any] = {}
+    for enum_val in enum:
+        enum_lower_map.setdefault(str(enum_val).lower(), enum_val)
+
+    # Enum columns repeat a handful of raw strings, so remember the outcome
+    # per distinct string and only lowercase each one once
+    str_results: Dict[str, Any] = {}
+
+    def lookup(value: Any) -> Any:
+        if type(value) is str:
+            result = str_results.get(value, _NO_MATCH)
+            if result is _NO_MATCH:
+                result = value if value in enum_set else enum_lower_map.get(value.lower(), _NO_MATCH)
+                str_results[value] = result
+            return result
+        try:
+            if value in enum_set:
+                return value
+        except TypeError:
+            pass
+        return enum_lower_map.get(str(value).lower(), _NO_MATCH)
+
+    return lookup
+
+
+# -----------------------------------------------------------------------------
+# Type converters
+# -----------------------------------------------------------------------------
+
+def _to_string(value: Any) -> Any:
+    return str(value) if value is not None else None
+
+
+def _to_number(value: Any) -> Any:
+    if value == "n/a" or value == "":
+        return value
+    return float(value)
+
+
+def _to_integer(value: Any) -> Any:
+    if value == "n/a" or value == "":
+        return value
+    return int(float(value))
+
+
+_TRUE_STRINGS = frozenset(("true", "1", "yes"))
+
+
+def _to_boolean(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in _TRUE_STRINGS
+
+
+def _to_object(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
+    return value
+
+
+def _to_array(value: Any) -> Any:
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return [value]
+    return [value]
+
+
+def _to_null(value: Any) -> Any:
+    return None
+
+
+def _keep_value(value: Any) -> Any:
+    return value
+
+
+_TYPE_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "string": _to_string,
+    "number": _to_number,
+    "integer": _to_integer,
+    "boolean": _to_boolean,
+    "object": _to_object,
+    "array": _to_array,
+    "null": _to_null,
+}
+
+# Python types that already satisfy a schema type as-is (exact type match,
+# so bools don't pass as numbers)
+_FAST_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,),
+}
+
+
+def _compile_type_converter(schema: Dict) -> Callable[[Any], Any]:
+    """
+    Resolve the converter for a schema's type once, ahead of the per-cell loop.
+
+    A list of types (e.g. ["string", "null"]) tries each in order and keeps
+    the value unchanged if none of them apply.
+    """
+    prop_type = schema.get("type")
+
+    if not isinstance(prop_type, list):
+        return _TYPE_CONVERTERS.get(prop_type, _keep_value)
+
+    converters = [(t, _TYPE_CONVERTERS.get(t, _keep_value)) for t in prop_type]
+
+    def convert_any(value: Any) -> Any:
+        for type_name, converter in converters:
+            if type_name == "null" and (value is None or value == ""):
+                return None
+            try:
+                return converter(value)
+            except (ValueError, TypeError):
+                continue
+        return value
+
+    return convert_any
+
 
 class ModelPopulator:
     """Schema-driven model population for Pennsieve datasets."""
@@ -91,11 +278,60 @@ class ModelPopulator:
         self.force_reload = force_reload
         self.verbose = verbose
         self._template_cache: Dict[str, Dict] = {}
+        self._plan_cache: Dict[str, Tuple[Dict, Dict, RecordPlan]] = {}
+        self._known_datasets: Dict[str, Dict] = {}
+        self._all_datasets: Optional[List[Dict]] = None
+        self._datasets_by_name: Optional[Dict[str, Dict]] = None
+        self._cache_lock = threading.Lock()
+        self._log_buffer = threading.local()
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a pooled HTTP session with retries on throttling/server errors.
+
+        Auth headers are passed per request rather than set on the session,
+        since presigned download URLs must not carry the Bearer token.
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_DOWNLOAD_WORKERS * MAX_DATASET_WORKERS,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _log(self, message: str, indent: int = 0):
         """Print log message with optional indentation."""
         prefix = "  " * indent
-        print(f"{prefix}{message}")
+        lines = getattr(self._log_buffer, "lines", None)
+        if lines is not None:
+            lines.append(f"{prefix}{message}")
+        else:
+            print(f"{prefix}{message}")
+
+    def populate_dataset_buffered(self, dataset_name: str, config: Dict) -> bool:
+        """
+        Run populate_dataset, printing its log as one block when it finishes.
+
+        Used when several datasets are populated concurrently so that their
+        output doesn't interleave line by line.
+        """
+        self._log_buffer.lines = []
+        try:
+            return self.populate_dataset(dataset_name, config)
+        finally:
+            lines = self._log_buffer.lines
+            self._log_buffer.lines = None
+            print("\n".join(lines), flush=True)
 
     def _debug(self, message: str, indent: int = 0):
         """Print debug message if verbose mode is on."""
@@ -113,7 +349,7 @@ class ModelPopulator:
 
         self._debug(f"Fetching templates from: {url}")
 
-        response = requests.get(url, headers=self.auth.get_headers())
+        response = self.session.get(url, headers=self.auth.get_headers())
         response.raise_for_status()
 
         return response.json()
@@ -124,13 +360,33 @@ class ModelPopulator:
         if cache_key in self._template_cache:
             return self._template_cache[cache_key]
 
-        templates = self.fetch_templates(org_id)
+        # Concurrent datasets share the template; fetch and cache it once
+        with self._cache_lock:
+            return self._load_template_schema(org_id, template_id, cache_key)
+
+    def _load_template_schema(self, org_id: str, template_id: str, cache_key: str) -> Optional[Dict]:
+        """Load a template schema from the disk cache or the API."""
+        if cache_key in self._template_cache:
+            return self._template_cache[cache_key]
+
+        schema_cache_key = f"template_{template_id}"
+        schema = load_data(schema_cache_key, force_reload=self.force_reload)
+        if schema is not None:
+            self._template_cache[cache_key] = schema
+            return schema
+
+        templates_cache_key = f"templates_{org_id.replace(':', '_')}"
+        templates = load_data(templates_cache_key, force_reload=self.force_reload)
+        if templates is None:
+            templates = self.fetch_templates(org_id)
+            save_data(templates, templates_cache_key)
 
         for item in templates:
             template = item.get("model_template", {})
             if template.get("id") == template_id:
                 schema = template.get("latest_version", {}).get("schema", {})
                 self._template_cache[cache_key] = schema
+                save_data(schema, schema_cache_key)
                 return schema
 
         return None
@@ -157,49 +413,85 @@ class ModelPopulator:
 
     def get_all_datasets(self) -> List[Dict]:
         """Fetch all datasets with caching."""
-        datasets = load_data("datasets", force_reload=self.force_reload)
-        if datasets is None:
-            self._log("Fetching datasets from network...")
-            datasets = self._fetch_all_datasets()
-            save_data(datasets, "datasets")
-        return datasets
+        with self._cache_lock:
+            if self._all_datasets is None:
+                datasets = load_data("datasets", force_reload=self.force_reload)
+                if datasets is None:
+                    self._log("Fetching datasets from network...")
+                    datasets = self._fetch_all_datasets()
+                    save_data(datasets, "datasets")
+                self._all_datasets = datasets
+            return self._all_datasets
+
+    def _fetch_datasets_page(self, offset: int, limit: int) -> Dict:
+        """Fetch one page of datasets via API."""
+        url = (
+            f"{API_HOST}/datasets/paginated"
+            f"?limit={limit}&offset={offset}"
+            f"&orderBy=Name&orderDirection=Asc"
+        )
+
+        response = self.session.get(url, headers=self.auth.get_headers())
+        response.raise_for_status()
+
+        return response.json()
 
     def _fetch_all_datasets(self) -> List[Dict]:
-        """Fetch all datasets via API."""
-        datasets = []
-        offset = 0
-        page_size = 25
+        """Fetch all datasets via API.
 
-        while True:
-            url = (
-                f"{API_HOST}/datasets/paginated"
-                f"?limit={page_size}&offset={offset}"
-                f"&orderBy=Name&orderDirection=Asc"
-            )
+        The first page reports totalCount, so the remaining pages are
+        fetched concurrently rather than one round trip at a time.
+        """
+        result = self._fetch_datasets_page(0, DATASETS_PAGE_SIZE)
+        datasets = list(result.get("datasets", []))
+        total_count = result.get("totalCount", 0)
 
-            response = requests.get(url, headers=self.auth.get_headers())
-            response.raise_for_status()
+        if not datasets or len(datasets) >= total_count:
+            return datasets
 
-            result = response.json()
-            batch = result.get("datasets", [])
-            if not batch:
-                break
+        # The server may cap the limit below what we asked for
+        page_size = len(datasets)
+        offsets = range(page_size, total_count, page_size)
 
-            datasets.extend(batch)
-            total_count = result.get("totalCount", 0)
-            offset += page_size
-            if offset >= total_count:
-                break
+        with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(offsets))) as executor:
+            pages = executor.map(
+                lambda offset: self._fetch_datasets_page(offset, page_size),
+                offsets
+            )
+            for page in pages:
+                datasets.extend(page.get("datasets", []))
 
         return datasets
 
+    def get_datasets_by_prefix(self, prefix: str) -> List[Dict]:
+        """
+        Return datasets whose name starts with prefix.
+
+        Filters the cached full listing from get_all_datasets(). Matches are
+        remembered so that find_dataset_by_name can return them directly.
+        """
+        matches = [
+            ds for ds in self.get_all_datasets()
+            if (ds.get("content") or {}).get("name", "").startswith(prefix)
+        ]
+
+        for ds in matches:
+            self._known_datasets.setdefault(ds["content"]["name"], ds)
+        return matches
+
     def find_dataset_by_name(self, name: str) -> Optional[Dict]:
         """Find a dataset by name."""
+        if name in self._known_datasets:
+            return self._known_datasets[name]
+
         datasets = self.get_all_datasets()
-        for ds in datasets:
-            if ds.get("content", {}).get("name") == name:
-                return ds
-        return None
+        with self._cache_lock:
+            if self._datasets_by_name is None:
+                by_name: Dict[str, Dict] = {}
+                for ds in datasets:
+                    by_name.setdefault(ds.get("content", {}).get("name"), ds)
+                self._datasets_by_name = by_name
+        return self._datasets_by_name.get(name)
 
     def get_dataset_packages(self, dataset_id: str) -> List[Dict]:
         """Get all packages for a dataset."""
@@ -218,7 +510,7 @@ class ModelPopulator:
 
         while True:
             url = f"{base_url}&cursor={cursor}" if cursor else base_url
-            response = requests.get(url, headers=self.auth.get_headers())
+            response = self.session.get(url, headers=self.auth.get_headers())
             response.raise_for_status()
 
             data = response.json()
@@ -232,72 +524,128 @@ class ModelPopulator:
 
     def get_package_path(self, package: Dict, all_packages: List[Dict]) -> str:
         """Get the folder path for a package."""
-        pkg_lookup = {
+        pkg_lookup = self._build_package_lookup(all_packages)
+        return self._get_package_path(package, pkg_lookup, {})
+
+    def _build_package_lookup(self, all_packages: List[Dict]) -> Dict[str, Dict]:
+        """Index packages by their id for parent lookups."""
+        return {
             pkg.get("content", {}).get("id"): pkg
             for pkg in all_packages
         }
 
-        path_parts = []
-        current = package
+    def _get_package_path(
+        self,
+        package: Dict,
+        pkg_lookup: Dict[str, Dict],
+        path_cache: Dict[str, str]
+    ) -> str:
+        """
+        Get the folder path for a package, memoizing folder paths.
 
-        while True:
-            content = current.get("content", {})
-            parent_id = content.get("parentId")
+        path_cache maps a folder id to its full path (including its own name),
+        so sibling packages only walk their parent chain once.
+        """
+        # Walk up until we hit the root or a folder whose path is cached
+        pending = []
+        parent_id = package.get("content", {}).get("parentId")
+        while parent_id and parent_id in pkg_lookup and parent_id not in path_cache:
+            pending.append(parent_id)
+            parent_id = pkg_lookup[parent_id].get("content", {}).get("parentId")
 
-            if not parent_id or parent_id not in pkg_lookup:
-                break
+        path = path_cache.get(parent_id, "") if parent_id else ""
 
-            parent = pkg_lookup[parent_id]
-            parent_name = parent.get("content", {}).get("name", "")
-            if parent_name:
-                path_parts.insert(0, parent_name)
-            current = parent
+        # Fill in the cache from the top of the chain down
+        for folder_id in reversed(pending):
+            folder_name = pkg_lookup[folder_id].get("content", {}).get("name", "")
+            if folder_name:
+                path = f"{path}/{folder_name}" if path else folder_name
+            path_cache[folder_id] = path
 
-        return "/".join(path_parts)
+        return path
 
-    def find_file_in_dataset(
+    def _index_packages(
         self,
-        packages: List[Dict],
-        file_pattern: str
-    ) -> Optional[Dict]:
-        """Find a file matching a pattern in dataset packages."""
+        packages: List[Dict]
+    ) -> Tuple[Dict[str, Dict], List[Tuple[str, Dict]]]:
+        """
+        Index the packages that are eligible for file lookups.
+
+        Deleted packages and anything under an archive folder are dropped.
+
+        Returns:
+            Tuple of (exact name -> package, [(name, package), ...]) where
+            the list keeps dataset order for suffix matching
+        """
+        pkg_lookup = self._build_package_lookup(packages)
+        path_cache: Dict[str, str] = {}
+
+        name_index: Dict[str, Dict] = {}
+        candidates: List[Tuple[str, Dict]] = []
+
         for pkg in packages:
-            content = pkg.get("content", {})
-            name = content.get("name", "")
+            name = pkg.get("content", {}).get("name", "")
 
             if name.startswith("__DELETED__"):
                 continue
 
-            pkg_path = self.get_package_path(pkg, packages)
+            pkg_path = self._get_package_path(pkg, pkg_lookup, path_cache)
             if "archive" in pkg_path.lower():
                 continue
 
-            if name == file_pattern or name.endswith(file_pattern):
+            name_index.setdefault(name, pkg)
+            candidates.append((name, pkg))
+
+        return name_index, candidates
+
+    def find_file_in_dataset(
+        self,
+        packages: List[Dict],
+        file_pattern: str,
+        package_index: Optional[Tuple[Dict[str, Dict], List[Tuple[str, Dict]]]] = None
+    ) -> Optional[Dict]:
+        """Find a file matching a pattern in dataset packages.
+
+        An exact name match is preferred over a suffix match. Pass
+        ``package_index`` from ``_index_packages()`` to reuse it across lookups.
+        """
+        if package_index is None:
+            package_index = self._index_packages(packages)
+        name_index, candidates = package_index
+
+        pkg = name_index.get(file_pattern)
+        if pkg is not None:
+            return pkg
+
+        for name, pkg in candidates:
+            if name.endswith(file_pattern):
                 return pkg
 
         return None
 
-    def download_file_content(self, node_id: str, package_id: str = None) -> str:
-        """Download file content from Pennsieve.
+    def download_file_stream(self, node_id: str) -> Iterator[str]:
+        """Stream file lines from Pennsieve.
 
         Uses the download-manifest endpoint with Bearer token authentication
-        (matching the working implementation in migrationtools).
+        (matching the working implementation in migrationtools), then streams
+        the presigned URL so the file is never held in memory as a whole.
+
+        It is consumed on download-pool threads, where the dataset's log
+        buffer isn't set, so it doesn't log; populate_dataset logs each
+        download before submitting it.
 
         Args:
             node_id: The nodeId of the package
-            package_id: The id of the package (not currently used, kept for API compatibility)
-        """
-        self._debug(f"Downloading file: nodeId={node_id}")
 
+        Yields:
+            Lines of the file, with line endings preserved
+        """
         manifest_url = f"{API_HOST}/packages/download-manifest"
         payload = {"nodeIds": [node_id]}
 
-        self._debug(f"POST {manifest_url}")
-        self._debug(f"Payload: {payload}")
-
-        response = requests.post(
+        response = self.session.post(
             manifest_url,
-            json=payload,
+            data=_dumps(payload),
             headers=self.auth.get_headers()
         )
         response.raise_for_status()
@@ -311,11 +659,15 @@ class ModelPopulator:
         if not download_url:
             raise ValueError("Manifest response missing 'url' key")
 
-        self._debug(f"Downloading from presigned URL...")
-        file_response = requests.get(download_url)
-        file_response.raise_for_status()
-
-        return file_response.text
+        with self.session.get(download_url, stream=True) as file_response:
+            file_response.raise_for_status()
+            file_response.raw.decode_content = True
+            # utf-8-sig drops a leading BOM, matching load_local_file, so it
+            # doesn't end up glued to the first header name
+            encoding = file_response.encoding
+            if not encoding or encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+                encoding = "utf-8-sig"
+            yield from io.TextIOWrapper(file_response.raw, encoding=encoding, newline="")
 
     def load_local_file(self, path: str) -> List[Dict[str, Any]]:
         """Load data from a local CSV/TSV/JSON file."""
@@ -324,30 +676,58 @@ class ModelPopulator:
         if not file_path.exists():
             raise FileNotFoundError(f"Local file not found: {path}")
 
-        content = file_path.read_text()
-        filename = file_path.name
+        with file_path.open("r", newline="", encoding="utf-8-sig") as f:
+            return self._parse_file_content(f, file_path.name)
 
-        return self._parse_file_content(content, filename)
+    def _parse_file_content(self, lines: Iterable[str], filename: str) -> List[Dict[str, Any]]:
+        """Parse file content into records.
+
+        Args:
+            lines: File content as a string or an iterable of lines
+                (an open file, or download_file_stream())
+            filename: Name used to pick the parser
+        """
+        if isinstance(lines, str):
+            lines = io.StringIO(lines, newline="")
 
-    def _parse_file_content(self, content: str, filename: str) -> List[Dict[str, Any]]:
-        """Parse file content into records."""
         if filename.endswith('.json'):
-            data = json.loads(content)
+            # Read open files in one call rather than line by line
+            content = lines.read() if hasattr(lines, "read") else "".join(lines)
+            data = _loads(content)
             return [data] if isinstance(data, dict) else data
         elif filename.endswith('.csv') or filename.endswith('.tsv'):
-            return self._csv_to_records(content)
+            return self._csv_to_records(lines)
         else:
-            # Try CSV first, then JSON
+            # Try CSV first, then JSON (needs the full content to retry)
+            content = "".join(lines)
             try:
-                return self._csv_to_records(content)
+                return self._csv_to_records(io.StringIO(content, newline=""))
             except Exception:
                 return json.loads(content)
 
-    def _csv_to_records(self, content: str) -> List[Dict[str, Any]]:
-        """Convert CSV/TSV content to records."""
-        dialect = csv.Sniffer().sniff(content[:1024], delimiters=',\t')
-        reader = csv.DictReader(io.StringIO(content), dialect=dialect)
-        return list(reader)
+    def _csv_to_records(self, lines: Iterable[str]) -> List[Dict[str, Any]]:
+        """Convert CSV/TSV lines to records, reading one row at a time."""
+        lines = iter(lines)
+
+        # Buffer just enough lines to sniff the dialect, then replay them
+        head = []
+        sample_size = 0
+        for line in lines:
+            head.append(line)
+            sample_size += len(line)
+            if sample_size >= 1024:
+                break
+
+        dialect = csv.Sniffer().sniff("".join(head)[:1024], delimiters=',\t')
+        reader = csv.reader(itertools.chain(head, lines), dialect=dialect)
+
+        header = next(reader, None)
+        if header is None:
+            return []
+
+        # Zip rows against the header directly; DictReader does the same work
+        # plus per-row bookkeeping we don't need. Blank lines are skipped.
+        return [dict(zip(header, row)) for row in reader if row]
 
     # -------------------------------------------------------------------------
     # Data Transformation
@@ -359,118 +739,105 @@ class ModelPopulator:
 
         Returns None if the value doesn't conform to the schema (will be excluded from record).
         """
-        if value is None or value == "" or value == "n/a":
-            # Check if "n/a" is explicitly allowed
+        return self._compile_transformer(prop_schema)(value)
+
+    def _compile_transformer(self, prop_schema: Dict) -> Callable[[Any], Any]:
+        """
+        Build a transformer for a single schema property.
+
+        The oneOf branches, enum lookups and "n/a" handling are resolved once
+        here so that transforming each cell is a single function call.
+        """
+        one_of = prop_schema.get("oneOf")
+        enum = prop_schema.get("enum")
+
+        # Check if "n/a" is explicitly allowed (in a oneOf enum or direct enum)
+        na_allowed = any(
+            "n/a" in option["enum"] for option in (one_of or []) if "enum" in option
+        ) or (enum is not None and "n/a" in enum)
+        na_result = "n/a" if na_allowed else None
+
+        def _xform_empty(value: Any) -> Any:
             if value == "n/a":
-                # Check oneOf for "n/a" enum
-                if "oneOf" in prop_schema:
-                    for option in prop_schema["oneOf"]:
-                        if "enum" in option and "n/a" in option["enum"]:
-                            return "n/a"
-                # Check direct enum
-                if "enum" in prop_schema and "n/a" in prop_schema["enum"]:
-                    return "n/a"
-                # n/a not allowed, exclude field
-                return None
+                return na_result
             return None
 
         # Handle oneOf (e.g., number OR "n/a")
-        if "oneOf" in prop_schema:
-            for option in prop_schema["oneOf"]:
-                # Check enum option
+        if one_of is not None:
+            branches = []
+            for option in one_of:
                 if "enum" in option:
-                    if value in option["enum"]:
-                        return value
-                    # Case-insensitive match
-                    for enum_val in option["enum"]:
-                        if str(value).lower() == str(enum_val).lower():
-                            return enum_val
-                # Check type option
+                    branches.append((_build_enum_lookup(option["enum"]), None))
                 elif "type" in option:
-                    try:
-                        transformed = self._transform_to_type(value, option)
-                        if transformed is not None:
-                            return transformed
-                    except (ValueError, TypeError):
-                        continue
-            # No option matched, exclude field
-            self._debug(f"Value '{value}' doesn't match any oneOf option, excluding")
-            return None
+                    branches.append((None, _compile_type_converter(option)))
+
+            def _xform_oneof(value: Any) -> Any:
+                if value is None or value == "" or value == "n/a":
+                    return _xform_empty(value)
+                for lookup, converter in branches:
+                    if lookup is not None:
+                        matched = lookup(value)
+                        if matched is not _NO_MATCH:
+                            return matched
+                    else:
+                        try:
+                            transformed = converter(value)
+                            if transformed is not None:
+                                return transformed
+                        except (ValueError, TypeError):
+                            continue
+                # No option matched, exclude field
+                self._debug(f"Value '{value}' doesn't match any oneOf option, excluding")
+                return None
+
+            return _xform_oneof
 
         # Handle enum
-        if "enum" in prop_schema:
-            if value in prop_schema["enum"]:
-                return value
-            # Try case-insensitive match
-            for enum_val in prop_schema["enum"]:
-                if str(value).lower() == str(enum_val).lower():
-                    return enum_val
-            # Value not in enum, exclude field
-            self._debug(f"Value '{value}' not in enum {prop_schema['enum']}, excluding")
-            return None
+        if enum is not None:
+            lookup = _build_enum_lookup(enum)
+
+            def _xform_enum(value: Any) -> Any:
+                if value is None or value == "" or value == "n/a":
+                    return _xform_empty(value)
+                matched = lookup(value)
+                if matched is not _NO_MATCH:
+                    return matched
+                # Value not in enum, exclude field
+                self._debug(f"Value '{value}' not in enum {enum}, excluding")
+                return None
+
+            return _xform_enum
 
         # Handle type
         prop_type = prop_schema.get("type")
         if prop_type:
-            return self._transform_to_type(value, prop_schema)
-
-        return value
+            converter = _compile_type_converter(prop_schema)
+            fast_types = _FAST_TYPES.get(prop_type, ()) if isinstance(prop_type, str) else ()
+
+            def _xform_type(value: Any) -> Any:
+                if value is None or value == "" or value == "n/a":
+                    return _xform_empty(value)
+                # Most cells already have the right Python type
+                if type(value) in fast_types:
+                    return value
+                return converter(value)
 
-    def _transform_to_type(self, value: Any, schema: Dict) -> Any:
-        """Transform value to match schema type."""
-        prop_type = schema.get("type")
+            return _xform_type
 
-        # Handle array of types (e.g., ["string", "null"])
-        if isinstance(prop_type, list):
-            for t in prop_type:
-                if t == "null" and (value is None or value == ""):
-                    return None
-                try:
-                    return self._convert_to_type(value, t)
-                except (ValueError, TypeError):
-                    continue
+        def _xform_passthrough(value: Any) -> Any:
+            if value is None or value == "" or value == "n/a":
+                return _xform_empty(value)
             return value
 
-        return self._convert_to_type(value, prop_type)
+        return _xform_passthrough
+
+    def _transform_to_type(self, value: Any, schema: Dict) -> Any:
+        """Transform value to match schema type."""
+        return _compile_type_converter(schema)(value)
 
     def _convert_to_type(self, value: Any, type_name: str) -> Any:
         """Convert value to a specific type."""
-        if type_name == "string":
-            return str(value) if value is not None else None
-        elif type_name == "number":
-            if value == "n/a" or value == "":
-                return value
-            return float(value)
-        elif type_name == "integer":
-            if value == "n/a" or value == "":
-                return value
-            return int(float(value))
-        elif type_name == "boolean":
-            if isinstance(value, bool):
-                return value
-            return str(value).lower() in ("true", "1", "yes")
-        elif type_name == "object":
-            if isinstance(value, dict):
-                return value
-            if isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return value
-            return value
-        elif type_name == "array":
-            if isinstance(value, list):
-                return value
-            if isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return [value]
-            return [value]
-        elif type_name == "null":
-            return None
-
-        return value
+        return _TYPE_CONVERTERS.get(type_name, _keep_value)(value)
 
     def build_record(
         self,
@@ -479,50 +846,126 @@ class ModelPopulator:
         schema: Dict,
         row_index: int = 0,
         join_key: Optional[str] = None,
-        join_value: Optional[str] = None
+        join_value: Optional[str] = None,
+        plan: Optional[RecordPlan] = None,
+        join_indexes: Optional[Dict[str, Dict[Any, Dict]]] = None
     ) -> Dict[str, Any]:
-        """Build a single record from mappings and source data."""
-        properties = self.get_schema_properties(schema)
-        record = {}
+        """Build a single record from mappings and source data.
 
-        for prop_name, prop_schema in properties.items():
+        Pass ``plan`` from ``compile_record_plan()`` and ``join_indexes``
+        from ``index_sources()`` when building many records against the
+        same schema and sources.
+        """
+        if plan is None:
+            plan = self.compile_record_plan(schema, mappings)
+        if join_indexes is None and join_key and join_value:
+            join_indexes = self.index_sources(source_data, join_key)
+
+        source_properties, constants = plan
+        record = dict(constants)
+
+        for prop_name, source_name, column_name, transform in source_properties:
+            source_records = source_data.get(source_name)
+            if source_records is None:
+                continue
+
+            # Find the right record
+            value = None
+            if join_key and join_value:
+                src_record = join_indexes[source_name].get(join_value)
+                if src_record is not None:
+                    value = src_record.get(column_name)
+            elif row_index < len(source_records):
+                value = source_records[row_index].get(column_name)
+
+            # Transform value to match schema (only include if valid)
+            if value is not None and value != "":
+                transformed = transform(value)
+                if transformed is not None:
+                    record[prop_name] = transformed
+
+        return record
+
+    def index_sources(
+        self,
+        source_data: Dict[str, List[Dict]],
+        join_key: str
+    ) -> Dict[str, Dict[Any, Dict]]:
+        """
+        Index each source's records by their join key value.
+
+        Lets build_record join secondary sources with a dict lookup instead
+        of scanning every source record per row. When several records share
+        a join value the first one wins.
+        """
+        join_indexes = {}
+        for source_name, source_records in source_data.items():
+            index: Dict[Any, Dict] = {}
+            for src_record in source_records:
+                index.setdefault(src_record.get(join_key), src_record)
+            join_indexes[source_name] = index
+        return join_indexes
+
+    def compile_record_plan(self, schema: Dict, mappings: Dict[str, Dict]) -> RecordPlan:
+        """
+        Work out once how each schema property gets its value.
+
+        Returns:
+            Tuple of (source_properties, constants) where source_properties is
+            a list of (property, source, column, transformer) read per row, and
+            constants holds schema defaults for unmapped properties plus the
+            already-transformed static values, shared by every record
+        """
+        source_properties = []
+        constants: Dict[str, Any] = {}
+
+        for prop_name, prop_schema in self.get_schema_properties(schema).items():
             if prop_name not in mappings:
                 # Check for default value in schema
                 if "default" in prop_schema:
-                    record[prop_name] = prop_schema["default"]
+                    constants[prop_name] = prop_schema["default"]
                 continue
 
             mapping = mappings[prop_name]
-            value = None
+            transform = self._compile_transformer(prop_schema)
 
             # Static value
             if "value" in mapping:
                 value = mapping["value"]
+                if value is not None and value != "":
+                    transformed = transform(value)
+                    if transformed is not None:
+                        constants[prop_name] = transformed
 
             # From source
             elif "source" in mapping and "column" in mapping:
-                source_name = mapping["source"]
-                column_name = mapping["column"]
+                source_properties.append(
+                    (prop_name, mapping["source"], mapping["column"], transform)
+                )
 
-                if source_name in source_data:
-                    source_records = source_data[source_name]
+        return source_properties, constants
 
-                    # Find the right record
-                    if join_key and join_value:
-                        for src_record in source_records:
-                            if src_record.get(join_key) == join_value:
-                                value = src_record.get(column_name)
-                                break
-                    elif row_index < len(source_records):
-                        value = source_records[row_index].get(column_name)
+    def get_record_plan(self, template_id: str, schema: Dict, mappings: Dict[str, Dict]) -> RecordPlan:
+        """
+        Return the record plan for a template, compiling it once per run.
 
-            # Transform value to match schema (only include if valid)
-            if value is not None and value != "":
-                transformed = self.transform_value(value, prop_schema)
-                if transformed is not None:
-                    record[prop_name] = transformed
+        The plan is reused across datasets as long as the same schema and
+        mappings objects are passed, which is the case when one config is
+        applied to many datasets.
+        """
+        cached = self._plan_cache.get(template_id)
+        if cached is not None and cached[0] is schema and cached[1] is mappings:
+            return cached[2]
 
-        return record
+        # Concurrent datasets share the plan; compile and cache it once
+        with self._cache_lock:
+            cached = self._plan_cache.get(template_id)
+            if cached is not None and cached[0] is schema and cached[1] is mappings:
+                return cached[2]
+
+            plan = self.compile_record_plan(schema, mappings)
+            self._plan_cache[template_id] = (schema, mappings, plan)
+            return plan
 
     # -------------------------------------------------------------------------
     # Model Operations
@@ -533,7 +976,7 @@ class ModelPopulator:
         encoded_id = quote(dataset_id, safe="")
         url = f"{API2_BASE_URL}/metadata/models?dataset_id={encoded_id}"
 
-        response = requests.get(url, headers=self.auth.get_headers())
+        response = self.session.get(url, headers=self.auth.get_headers())
         response.raise_for_status()
 
         models = response.json()
@@ -550,7 +993,7 @@ class ModelPopulator:
 
         # First, get all records
         url = f"{API2_BASE_URL}/metadata/models/{model_id}/records?dataset_id={encoded_id}&limit=1000"
-        response = requests.get(url, headers=self.auth.get_headers())
+        response = self.session.get(url, headers=self.auth.get_headers())
 
         if not response.ok:
             self._debug(f"Failed to get records: {response.status_code}")
@@ -574,9 +1017,9 @@ class ModelPopulator:
 
         # Delete records
         delete_url = f"{API2_BASE_URL}/metadata/models/{model_id}/records?dataset_id={encoded_id}"
-        delete_response = requests.delete(
+        delete_response = self.session.delete(
             delete_url,
-            json=record_ids,
+            data=_dumps(record_ids),
             headers=self.auth.get_headers()
         )
 
@@ -622,7 +1065,7 @@ class ModelPopulator:
             self._log("[DRY-RUN] Would create model")
             return "dry-run-model-id"
 
-        response = requests.post(url, json=payload, headers=self.auth.get_headers())
+        response = self.session.post(url, data=_dumps(payload), headers=self.auth.get_headers())
         response.raise_for_status()
 
         result = response.json()
@@ -638,8 +1081,6 @@ class ModelPopulator:
         encoded_id = quote(dataset_id, safe="")
         url = f"{API2_BASE_URL}/metadata/models/{model_id}/records?dataset_id={encoded_id}"
 
-        payload = {"records": records}
-
         self._debug(f"Posting {len(records)} records to: {url}")
 
         if self.dry_run:
@@ -647,14 +1088,29 @@ class ModelPopulator:
             self._log(f"[DRY-RUN] Sample record: {json.dumps(records[0] if records else {}, indent=2)}")
             return True
 
-        response = requests.post(url, json=payload, headers=self.auth.get_headers())
+        # Post in batches so one failed request doesn't sink the whole upload
+        starts = range(0, max(len(records), 1), RECORDS_BATCH_SIZE)
+        headers = self.auth.get_headers()
 
-        if not response.ok:
-            self._log(f"ERROR: {response.status_code}")
-            self._log(f"Response: {response.text}")
+        def post_batch(start: int) -> requests.Response:
+            batch = records[start:start + RECORDS_BATCH_SIZE]
+            return self.session.post(url, data=_dumps({"records": batch}), headers=headers)
+
+        with ThreadPoolExecutor(max_workers=min(MAX_POST_WORKERS, len(starts))) as executor:
+            responses = list(executor.map(post_batch, starts))
+
+        failed = 0
+        for start, response in zip(starts, responses):
+            if not response.ok:
+                end = min(start + RECORDS_BATCH_SIZE, len(records))
+                self._log(f"ERROR: records {start + 1}-{end}: {response.status_code}")
+                self._log(f"Response: {response.text}")
+                failed += end - start
+
+        if failed:
+            self._log(f"Posted {len(records) - failed} of {len(records)} records, {failed} failed")
             return False
 
-        response.raise_for_status()
         self._log(f"Posted {len(records)} records successfully")
         return True
 
@@ -700,8 +1156,10 @@ class ModelPopulator:
 
         # Load data sources
         self._log(f"\nStep 2: Loading data sources...", indent=1)
-        source_data: Dict[str, List[Dict]] = {}
+        loaded: Dict[str, List[Dict]] = {}
+        downloads: Dict[str, Tuple[str, str]] = {}
         packages = None
+        package_index = None
 
         for source_name, source_config in config.get("sources", {}).items():
             source_type = source_config.get("type")
@@ -709,9 +1167,10 @@ class ModelPopulator:
             if source_type == "pennsieve":
                 if packages is None:
                     packages = self.get_dataset_packages(dataset_id)
+                    package_index = self._index_packages(packages)
 
                 file_pattern = source_config.get("file_pattern")
-                pkg = self.find_file_in_dataset(packages, file_pattern)
+                pkg = self.find_file_in_dataset(packages, file_pattern, package_index)
 
                 if not pkg:
                     self._log(f"WARNING: File not found: {file_pattern}", indent=2)
@@ -724,13 +1183,10 @@ class ModelPopulator:
                 self._debug(f"nodeId: {node_id}, packageId: {package_id}", indent=3)
 
                 if not self.dry_run:
-                    content = self.download_file_content(node_id, package_id)
-                    records = self._parse_file_content(content, filename)
-                    source_data[source_name] = records
-                    self._log(f"Loaded {len(records)} records from {source_name}", indent=3)
+                    downloads[source_name] = (node_id, filename)
                 else:
                     self._log(f"[DRY-RUN] Would download {filename}", indent=3)
-                    source_data[source_name] = []
+                    loaded[source_name] = []
 
             elif source_type == "local":
                 path = source_config.get("path")
@@ -738,11 +1194,40 @@ class ModelPopulator:
 
                 try:
                     records = self.load_local_file(path)
-                    source_data[source_name] = records
+                    loaded[source_name] = records
                     self._log(f"Loaded {len(records)} records from {source_name}", indent=3)
                 except FileNotFoundError as e:
                     self._log(f"WARNING: {e}", indent=2)
 
+        # Download Pennsieve sources concurrently; each worker streams and parses its file
+        if downloads:
+            self._log(f"Downloading {len(downloads)} file(s)...", indent=2)
+            workers = min(MAX_DOWNLOAD_WORKERS, len(downloads))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for source_name, (node_id, filename) in downloads.items():
+                    # Logged here, on the dataset's thread, so it lands in its buffer
+                    self._debug(f"Downloading file: nodeId={node_id}", indent=3)
+                    self._debug(f"POST {API_HOST}/packages/download-manifest, then the presigned URL", indent=3)
+                    future = executor.submit(
+                        self._parse_file_content,
+                        self.download_file_stream(node_id),
+                        filename
+                    )
+                    futures[future] = source_name
+                for future in as_completed(futures):
+                    source_name = futures[future]
+                    records = future.result()
+                    loaded[source_name] = records
+                    self._log(f"Loaded {len(records)} records from {source_name}", indent=3)
+
+        # Keep config order; the first source is the primary one
+        source_data: Dict[str, List[Dict]] = {
+            source_name: loaded[source_name]
+            for source_name in config.get("sources", {})
+            if source_name in loaded
+        }
+
         # Build records
         self._log(f"\nStep 3: Building records...", indent=1)
         mappings = config.get("mappings", {})
@@ -759,30 +1244,41 @@ class ModelPopulator:
         required_fields = self.get_required_fields(schema)
         self._log(f"Required fields: {required_fields}", indent=2)
 
+        plan = self.get_record_plan(template_id, schema, mappings)
+        join_indexes = self.index_sources(source_data, join_key) if join_key else None
+        required_set = frozenset(required_fields)
+
+        # Bind per-row callables once; this loop runs for every primary row
+        build_record = self.build_record
+        has_required = required_set.issubset
+
         records = []
+        add_record = records.append
         skipped = []
         for i, primary_record in enumerate(primary_records):
             join_value = primary_record.get(join_key) if join_key else None
 
-            record = self.build_record(
+            record = build_record(
                 mappings=mappings,
                 source_data=source_data,
                 schema=schema,
                 row_index=i,
                 join_key=join_key,
-                join_value=join_value
+                join_value=join_value,
+                plan=plan,
+                join_indexes=join_indexes
             )
 
-            # Check required fields
-            missing_required = [f for f in required_fields if f not in record]
-            if missing_required:
+            # Check required fields (list the missing ones only on failure)
+            if not has_required(record):
+                missing_required = [f for f in required_fields if f not in record]
                 record_id = record.get(key_field, f"row {i}")
                 self._log(f"WARNING: Record '{record_id}' missing required fields: {missing_required}", indent=2)
                 skipped.append((record_id, missing_required))
                 continue
 
             if record:
-                records.append(record)
+                add_record(record)
 
         self._log(f"Built {len(records)} valid records", indent=2)
         if skipped:
@@ -897,8 +1393,8 @@ class ModelPopulator:
         }
 
         if output_path:
-            with open(output_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            with open(output_path, 'wb') as f:
+                f.write(_dumps(config, pretty=True))
             self._log(f"Config written to: {output_path}")
 
         return config
@@ -951,6 +1447,8 @@ Examples:
     parser.add_argument('--dry-run', action='store_true', help='Preview without making changes')
     parser.add_argument('--force-reload', action='store_true', help='Bypass cache')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose output')
+    parser.add_argument('--workers', type=int, default=MAX_DATASET_WORKERS,
+                        help=f'Datasets to populate concurrently (default: {MAX_DATASET_WORKERS})')
 
     args = parser.parse_args()
 
@@ -985,22 +1483,19 @@ Examples:
             output_path=args.output
         )
         if not args.output:
-            print(json.dumps(config, indent=2))
+            print(_dumps(config, pretty=True).decode("utf-8"))
         return
 
     # Population mode
-    with open(args.config) as f:
-        config = json.load(f)
+    with open(args.config, 'rb') as f:
+        config = _loads(f.read())
 
     # Get dataset list
     if args.datasets:
         dataset_names = args.datasets
     else:
-        all_datasets = populator.get_all_datasets()
         dataset_names = [
-            ds.get("content", {}).get("name")
-            for ds in all_datasets
-            if ds.get("content", {}).get("name", "").startswith(args.prefix)
+            ds["content"]["name"] for ds in populator.get_datasets_by_prefix(args.prefix)
         ]
 
     if not dataset_names:
@@ -1018,15 +1513,24 @@ Examples:
     success_count = 0
     fail_count = 0
 
-    for dataset_name in dataset_names:
-        try:
-            if populator.populate_dataset(dataset_name, config):
-                success_count += 1
-            else:
+    workers = max(1, min(args.workers, len(dataset_names)))
+    populate = populator.populate_dataset if workers == 1 else populator.populate_dataset_buffered
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(populate, dataset_name, config): dataset_name
+            for dataset_name in dataset_names
+        }
+        for future in as_completed(futures):
+            dataset_name = futures[future]
+            try:
+                if future.result():
+                    success_count += 1
+                else:
+                    fail_count += 1
+            except Exception as e:
+                print(f"ERROR processing {dataset_name}: {e}")
                 fail_count += 1
-        except Exception as e:
-            print(f"ERROR processing {dataset_name}: {e}")
-            fail_count += 1
 
     # Summary
     print(f"\n{'='*60}")
@@ -26,11 +26,15 @@ Usage:
 
 import argparse
 import logging
+import os
 import re
 import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
 
 # Set up import paths
 _this_dir = Path(__file__).parent
@@ -42,19 +46,44 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('pennsieve_upload.log'),
+        logging.FileHandler('pennsieve_upload.log', delay=True),
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from shared.auth import PennsieveAuth
+
+# Datasets uploaded concurrently by default
+MAX_UPLOAD_WORKERS = 8
+
+# Paths passed to a single `pennsieve manifest add` call
+MANIFEST_ADD_BATCH_SIZE = 1000
+
+# Rule printed above and below each dataset's banner
+BANNER_RULE = '=' * 60
+
+# Lines of upload output kept for the error message when an upload fails
+UPLOAD_OUTPUT_TAIL_LINES = 20
+
 
 class PennsieveUploader:
     """Upload files and directories to Pennsieve using the CLI."""
 
-    def __init__(self, dry_run: bool = False, verbose: bool = False):
+    def __init__(
+        self,
+        dry_run: bool = False,
+        verbose: bool = False,
+        auth: Optional["PennsieveAuth"] = None
+    ):
         self.dry_run = dry_run
         self.verbose = verbose
+        self.auth = auth
+        self._node_ids: Dict[str, Optional[str]] = {}
+        self._dataset_index: Optional[Dict[str, Dict]] = None
+        self._lookup_lock = threading.Lock()
+        self._active_dataset_lock = threading.Lock()
 
         if verbose:
             logger.setLevel(logging.DEBUG)
@@ -72,9 +101,54 @@ class PennsieveUploader:
         return result.returncode, result.stdout, result.stderr
 
     def find_dataset_node_id(self, dataset_name: str) -> Optional[str]:
-        """Find the Pennsieve node ID for a dataset."""
+        """Find the Pennsieve node ID for a dataset.
+
+        With API credentials, the name is looked up in the dataset listing
+        fetched once over HTTP; otherwise it is resolved through the CLI. Results are cached for the lifetime
+        of the uploader.
+        """
         logger.info(f"Looking up dataset: {dataset_name}")
 
+        with self._lookup_lock:
+            cached = dataset_name in self._node_ids
+            node_id = self._node_ids.get(dataset_name)
+
+        if not cached:
+            if self.auth is not None:
+                node_id = self._lookup_node_id_via_api(dataset_name)
+            else:
+                node_id = self._lookup_node_id_via_cli(dataset_name)
+            with self._lookup_lock:
+                self._node_ids[dataset_name] = node_id
+
+        if node_id:
+            logger.info(f"  Found: {node_id}")
+        return node_id
+
+    def _lookup_node_id_via_api(self, dataset_name: str) -> Optional[str]:
+        """Resolve a dataset name from the full dataset listing.
+
+        The listing is fetched once, on the first lookup, and indexed by name;
+        concurrent workers wait for that fetch instead of repeating it.
+        """
+        from shared.helpers import build_dataset_index, get_all_datasets
+
+        with self._lookup_lock:
+            if self._dataset_index is None:
+                self._dataset_index = build_dataset_index(
+                    get_all_datasets(headers=self.auth.get_headers())
+                )
+            ds = self._dataset_index.get(dataset_name)
+
+        dataset_id = (ds or {}).get("content", {}).get("id")
+        if dataset_id:
+            return dataset_id
+
+        logger.error(f"Failed to find dataset '{dataset_name}'")
+        return None
+
+    def _lookup_node_id_via_cli(self, dataset_name: str) -> Optional[str]:
+        """Resolve a dataset name with `pennsieve dataset find`."""
         returncode, stdout, stderr = self._run_command(
             ['pennsieve', 'dataset', 'find', dataset_name]
         )
@@ -86,9 +160,7 @@ class PennsieveUploader:
         match = re.search(r'(N:dataset:[\w-]+)', stdout)
 
         if match:
-            node_id = match.group(1)
-            logger.info(f"  Found: {node_id}")
-            return node_id
+            return match.group(1)
         else:
             logger.error(f"Could not parse node ID from output: {stdout}")
             return None
@@ -129,23 +201,31 @@ class PennsieveUploader:
         if path.is_file():
             return [path]
 
-        # It's a directory - get all files recursively
+        # Match all patterns in a single pass over each name
+        pattern_re = re.compile('|'.join(map(re.escape, patterns))) if patterns else None
+
+        # It's a directory - walk it, pruning hidden entries at the branch
         files = []
-        for item in path.rglob('*'):
-            if item.is_dir():
-                continue
+        stack = [str(path)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        logger.debug(f"Skipping hidden entry: {entry.path}")
+                        continue
 
-            # Skip hidden files
-            if any(part.startswith('.') for part in item.parts):
-                logger.debug(f"Skipping hidden file: {item}")
-                continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
 
-            # Apply pattern filter if specified
-            if patterns:
-                if not any(p in item.name for p in patterns):
-                    continue
+                    if not entry.is_file():
+                        continue
 
-            files.append(item)
+                    # Apply pattern filter if specified
+                    if pattern_re is not None and not pattern_re.search(entry.name):
+                        continue
+
+                    files.append(Path(entry.path))
 
         return sorted(files)
 
@@ -157,7 +237,7 @@ class PennsieveUploader:
             logger.info(f"  [DRY RUN] Would create manifest (target: {target_path or 'root'})")
             return 999  # Fake manifest ID for dry run
 
-        full_path = file_path.resolve()
+        full_path = file_path if file_path.is_absolute() else file_path.resolve()
         cmd = ['pennsieve', 'manifest', 'create', str(full_path)]
         if target_path and target_path != '.':
             cmd.extend(['-t', target_path])
@@ -185,27 +265,47 @@ class PennsieveUploader:
         base_path: Path
     ) -> bool:
         """Add a file to an existing manifest."""
-        if self.dry_run:
-            logger.debug(f"  [DRY RUN] Would add to manifest: {file_path}")
-            return True
+        return self.add_many_to_manifest(manifest_id, [file_path], base_path)
 
-        full_path = file_path.resolve()
+    def add_many_to_manifest(
+        self,
+        manifest_id: int,
+        files: List[Path],
+        base_path: Path
+    ) -> bool:
+        """
+        Add files to an existing manifest, one CLI call per target folder.
 
-        # Calculate target path relative to base
-        try:
-            relative_path = file_path.relative_to(base_path)
-            target_path = str(relative_path.parent)
-        except ValueError:
-            target_path = None
+        Files are grouped by their folder relative to base_path so a whole
+        directory is added with a single `pennsieve manifest add` process.
+        """
+        # Group files by target path relative to base
+        by_target: Dict[Optional[str], List[str]] = {}
+        for file_path in files:
+            try:
+                relative_path = file_path.relative_to(base_path)
+                target_path = str(relative_path.parent)
+            except ValueError:
+                target_path = None
+            full_path = file_path if file_path.is_absolute() else file_path.resolve()
+            by_target.setdefault(target_path, []).append(str(full_path))
+
+        for target_path, paths in by_target.items():
+            if self.dry_run:
+                logger.debug(f"  [DRY RUN] Would add {len(paths)} file(s) to manifest (target: {target_path or 'root'})")
+                continue
 
-        cmd = ['pennsieve', 'manifest', 'add', str(manifest_id), str(full_path)]
-        if target_path and target_path != '.':
-            cmd.extend(['-t', target_path])
+            target_args = ['-t', target_path] if target_path and target_path != '.' else []
 
-        returncode, stdout, stderr = self._run_command(cmd)
-        if returncode != 0:
-            logger.error(f"Failed to add file to manifest: {stderr}")
-            return False
+            # Batch the paths so a large folder can't exceed the OS argv limit
+            for start in range(0, len(paths), MANIFEST_ADD_BATCH_SIZE):
+                batch = paths[start:start + MANIFEST_ADD_BATCH_SIZE]
+                cmd = ['pennsieve', 'manifest', 'add', str(manifest_id), *batch, *target_args]
+
+                returncode, stdout, stderr = self._run_command(cmd)
+                if returncode != 0:
+                    logger.error(f"Failed to add {len(batch)} file(s) to manifest (target: {target_path or 'root'}): {stderr}")
+                    return False
 
         return True
 
@@ -217,16 +317,29 @@ class PennsieveUploader:
             logger.info(f"  [DRY RUN] Would upload manifest {manifest_id}")
             return True
 
-        returncode, stdout, stderr = self._run_command(
-            ['pennsieve', 'upload', 'manifest', str(manifest_id)],
-            capture_output=True
-        )
+        cmd = ['pennsieve', 'upload', 'manifest', str(manifest_id)]
+        logger.debug(f"Running command: {' '.join(cmd)}")
 
-        if stdout:
-            logger.info(f"Upload output: {stdout}")
+        # Stream the CLI's progress output rather than buffering all of it;
+        # only the last few lines are kept for the error message
+        tail: Deque[str] = deque(maxlen=UPLOAD_OUTPUT_TAIL_LINES)
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                line = line.rstrip()
+                if line:
+                    logger.info(f"  [{manifest_id}] {line}")
+                    tail.append(line)
+        returncode = proc.returncode
 
         if returncode != 0:
-            logger.error(f"Failed to upload manifest: {stderr}")
+            output = "\n".join(tail)
+            logger.error(f"Failed to upload manifest: {output}")
             return False
 
         logger.info(f"Successfully uploaded manifest {manifest_id}")
@@ -249,10 +362,13 @@ class PennsieveUploader:
         Returns:
             True if successful, False otherwise
         """
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Uploading to dataset: {dataset_name}")
-        logger.info(f"Source: {path}")
-        logger.info(f"{'='*60}")
+        # One record, so concurrent uploads can't interleave banner lines
+        logger.info(
+            f"\n{BANNER_RULE}\n"
+            f"Uploading to dataset: {dataset_name}\n"
+            f"Source: {path}\n"
+            f"{BANNER_RULE}"
+        )
 
         # Step 1: Find the dataset
         node_id = self.find_dataset_node_id(dataset_name)
@@ -260,11 +376,9 @@ class PennsieveUploader:
             logger.error(f"Dataset not found: {dataset_name}")
             return False
 
-        # Step 2: Set active dataset
-        if not self.set_active_dataset(node_id):
-            return False
-
-        # Step 3: Get files to upload
+        # Step 2: Get files to upload. Resolving the root once makes every
+        # discovered path absolute, so files need no per-file resolve().
+        path = path.resolve()
         files = self.get_files_to_upload(path, patterns)
 
         if not files:
@@ -277,7 +391,7 @@ class PennsieveUploader:
             for f in files:
                 logger.debug(f"  - {f}")
 
-        # Step 4: Create manifest with first file
+        # Step 3: Create manifest with first file
         first_file = files[0]
         base_path = path if path.is_dir() else path.parent
 
@@ -287,17 +401,21 @@ class PennsieveUploader:
         except ValueError:
             target_path = None
 
-        manifest_id = self.create_manifest(first_file, target_path)
-        if manifest_id is None:
-            return False
+        # Step 4: Set active dataset. The CLI's active dataset is global and
+        # a new manifest binds to it, so concurrent uploads take turns here.
+        with self._active_dataset_lock:
+            if not self.set_active_dataset(node_id):
+                return False
+
+            manifest_id = self.create_manifest(first_file, target_path)
+            if manifest_id is None:
+                return False
 
         # Step 5: Add remaining files to manifest
         if len(files) > 1:
             logger.info(f"Adding {len(files) - 1} additional file(s) to manifest...")
-            for file_path in files[1:]:
-                if not self.add_to_manifest(manifest_id, file_path, base_path):
-                    logger.error(f"Failed to add file: {file_path}")
-                    return False
+            if not self.add_many_to_manifest(manifest_id, files[1:], base_path):
+                return False
 
         # Step 6: Upload
         if not self.dry_run:
@@ -310,6 +428,40 @@ class PennsieveUploader:
         return True
 
 
+def upload_all(
+    uploader: PennsieveUploader,
+    jobs: List[Tuple[str, Path]],
+    patterns: Optional[List[str]],
+    workers: int
+) -> Tuple[int, int]:
+    """
+    Upload each (dataset_name, path) job, running up to `workers` at once.
+
+    Returns:
+        Tuple of (success_count, failure_count)
+    """
+    success_count = 0
+    failure_count = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs)))) as executor:
+        futures = {
+            executor.submit(uploader.upload_to_dataset, dataset_name, path, patterns): dataset_name
+            for dataset_name, path in jobs
+        }
+        for future in as_completed(futures):
+            dataset_name = futures[future]
+            try:
+                if future.result():
+                    success_count += 1
+                else:
+                    failure_count += 1
+            except Exception as e:
+                logger.error(f"Error uploading to {dataset_name}: {e}")
+                failure_count += 1
+
+    return success_count, failure_count
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Upload files and directories to Pennsieve datasets using the CLI',
@@ -355,6 +507,12 @@ Examples:
                         help='Preview without making changes')
     parser.add_argument('--verbose', action='store_true',
                         help='Enable verbose logging')
+    parser.add_argument('--workers', type=int, default=MAX_UPLOAD_WORKERS,
+                        help=f'Datasets to upload concurrently (default: {MAX_UPLOAD_WORKERS})')
+
+    # Optional API credentials for dataset lookups (otherwise the CLI is used)
+    parser.add_argument('--api-key', help='Pennsieve API key (speeds up dataset lookups)')
+    parser.add_argument('--api-secret', help='Pennsieve API secret')
 
     args = parser.parse_args()
 
@@ -374,7 +532,17 @@ Examples:
     if args.source_dir and not args.match_names:
         parser.error("--source-dir requires --match-names flag")
 
-    uploader = PennsieveUploader(dry_run=args.dry_run, verbose=args.verbose)
+    if bool(args.api_key) != bool(args.api_secret):
+        parser.error("--api-key and --api-secret must be used together")
+
+    auth = None
+    if args.api_key:
+        from shared.auth import PennsieveAuth
+
+        auth = PennsieveAuth()
+        auth.authenticate(args.api_key, args.api_secret)
+
+    uploader = PennsieveUploader(dry_run=args.dry_run, verbose=args.verbose, auth=auth)
 
     if args.dry_run:
         logger.info("\n" + "="*60)
@@ -387,18 +555,12 @@ Examples:
             logger.error(f"Path does not exist: {args.path}")
             sys.exit(1)
 
-        success_count = 0
-        failure_count = 0
-
-        for dataset_name in args.datasets:
-            try:
-                if uploader.upload_to_dataset(dataset_name, args.path, args.pattern):
-                    success_count += 1
-                else:
-                    failure_count += 1
-            except Exception as e:
-                logger.error(f"Error uploading to {dataset_name}: {e}")
-                failure_count += 1
+        success_count, failure_count = upload_all(
+            uploader,
+            [(dataset_name, args.path) for dataset_name in args.datasets],
+            args.pattern,
+            args.workers
+        )
 
         # Summary
         logger.info(f"\n{'='*60}")
@@ -444,19 +606,9 @@ Examples:
 
         logger.info(f"Found {len(dataset_dirs)} dataset folder(s)")
 
-        success_count = 0
-        failure_count = 0
-        skipped_count = 0
-
-        for dataset_name, dataset_dir in dataset_dirs:
-            try:
-                if uploader.upload_to_dataset(dataset_name, dataset_dir, args.pattern):
-                    success_count += 1
-                else:
-                    failure_count += 1
-            except Exception as e:
-                logger.error(f"Error uploading {dataset_name}: {e}")
-                failure_count += 1
+        success_count, failure_count = upload_all(
+            uploader, dataset_dirs, args.pattern, args.workers
+        )
 
         # Summary
         logger.info(f"\n{'='*60}")
@@ -6,11 +6,14 @@ sidecar-generation and dataset-management modules.
 """
 
 from .config import BaseConfig, API_HOST, PAGE_SIZE, CACHE_DIR, OUTPUT_DIR
-from .auth import PennsieveAuth, authenticate, get_headers, get_token, get_auth
+from .auth import PennsieveAuth, authenticate, get_headers, get_token, get_auth, get_session
 from .helpers import (
     get_all_datasets,
+    build_dataset_index,
     find_dataset_by_name,
     get_dataset_packages,
+    iter_dataset_packages,
+    get_download_manifests,
     get_freq_duration,
     get_electrode_data,
     save_data,
@@ -20,6 +23,7 @@ from .helpers import (
     generate_new_name,
     sanitize_group_name,
     clean_channel_name,
+    ChannelInfo,
     get_channel_info,
     multi_dataset_read_csv_to_dict,
     read_csv_to_dict,
@@ -39,10 +43,14 @@ __all__ = [
     "get_headers",
     "get_token",
     "get_auth",
+    "get_session",
     # Helpers
     "get_all_datasets",
+    "build_dataset_index",
     "find_dataset_by_name",
     "get_dataset_packages",
+    "iter_dataset_packages",
+    "get_download_manifests",
     "get_freq_duration",
     "get_electrode_data",
     "save_data",
@@ -52,6 +60,7 @@ __all__ = [
     "generate_new_name",
     "sanitize_group_name",
     "clean_channel_name",
+    "ChannelInfo",
     "get_channel_info",
     "multi_dataset_read_csv_to_dict",
     "read_csv_to_dict",
@@ -5,16 +5,25 @@ Handles authentication via Cognito using API key + secret to obtain a Bearer tok
 All API calls should use this token-based authentication.
 """
 
+import hashlib
+import json
 import logging
-from typing import Optional, Dict
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Dict, Tuple
 
-import boto3
-import requests
+from .config import API_HOST, CACHE_DIR, ensure_dir
 
-from .config import API_HOST
+# boto3 and requests are slow to import, so they are loaded on first use
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
+# Seconds before expiry at which a cached token is no longer reused
+TOKEN_EXPIRY_MARGIN = 60
+
 
 class PennsieveAuth:
     """
@@ -31,6 +40,9 @@ class PennsieveAuth:
     def __init__(self, api_host: str = API_HOST):
         self.api_host = api_host
         self._token: Optional[str] = None
+        self._expires_at: float = 0.0
+        self._credentials: Optional[Tuple[str, str]] = None
+        self._refresh_lock = threading.Lock()
 
     def authenticate(self, api_key: str, api_secret: str) -> str:
         """
@@ -46,11 +58,17 @@ class PennsieveAuth:
         Raises:
             Exception: If authentication fails
         """
+        self._credentials = (api_key, api_secret)
+        cache_path = self._token_cache_path(api_key, api_secret)
+        if self._load_cached_token(cache_path):
+            logger.info("Using cached Pennsieve token")
+            return self._token
+
         logger.info("Authenticating with Pennsieve...")
         url = f"{self.api_host}/authentication/cognito-config"
 
         try:
-            response = requests.get(url)
+            response = get_session().get(url)
             response.raise_for_status()
             data = response.json()
 
@@ -60,6 +78,8 @@ class PennsieveAuth:
             logger.debug(f"Cognito region: {cognito_region}")
             logger.debug(f"App client ID: {cognito_app_client_id}")
 
+            import boto3
+
             cognito_idp_client = boto3.client(
                 "cognito-idp",
                 region_name=cognito_region,
@@ -73,19 +93,74 @@ class PennsieveAuth:
                 ClientId=cognito_app_client_id,
             )
 
-            self._token = login_response["AuthenticationResult"]["AccessToken"]
+            result = login_response["AuthenticationResult"]
+            self._token = result["AccessToken"]
+            expires_in = result.get("ExpiresIn")
+            self._expires_at = time.time() + expires_in if expires_in else 0.0
             logger.info("Authentication successful")
-            return self._token
 
         except Exception as e:
             logger.error(f"Authentication failed: {e}")
             raise
 
+        self._save_cached_token(cache_path)
+        return self._token
+
+    # -------------------------------------------------------------------------
+    # Token cache
+    # -------------------------------------------------------------------------
+
+    def _token_cache_path(self, api_key: str, api_secret: str) -> str:
+        """Return the on-disk token cache path for these credentials."""
+        key_hash = hashlib.sha256(
+            f"{self.api_host}|{api_key}|{api_secret}".encode("utf-8")
+        ).hexdigest()[:16]
+        return os.path.join(CACHE_DIR, f"token_{key_hash}.json")
+
+    def _load_cached_token(self, cache_path: str) -> bool:
+        """Load a cached token if one exists and has not (nearly) expired."""
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            token = cached["token"]
+            expires_at = float(cached["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        if time.time() >= expires_at - TOKEN_EXPIRY_MARGIN:
+            return False
+
+        self._token = token
+        self._expires_at = expires_at
+        return True
+
+    def _save_cached_token(self, cache_path: str) -> None:
+        """Write the current token to the cache, readable only by the owner."""
+        try:
+            ensure_dir(CACHE_DIR)
+            fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"token": self._token, "expires_at": self._expires_at}, f)
+        except OSError as e:
+            logger.warning(f"Could not cache token ({e})")
+
+    def _refresh_if_expiring(self) -> None:
+        """Re-authenticate with the stored credentials if the token is about to expire."""
+        if not self._expires_at or time.time() < self._expires_at - TOKEN_EXPIRY_MARGIN:
+            return
+
+        # Only the first caller past expiry logs in again; the rest wait for it
+        with self._refresh_lock:
+            if self._credentials and time.time() >= self._expires_at - TOKEN_EXPIRY_MARGIN:
+                logger.info("Access token expiring, re-authenticating...")
+                self.authenticate(*self._credentials)
+
     @property
     def token(self) -> str:
         """Get the current access token."""
         if not self._token:
             raise ValueError("Not authenticated. Call authenticate() first.")
+        self._refresh_if_expiring()
         return self._token
 
     @property
@@ -100,24 +175,66 @@ class PennsieveAuth:
         Returns:
             Dict with Authorization header and content type
         """
-        if not self._token:
-            raise ValueError("Not authenticated. Call authenticate() first.")
         return {
             "accept": "application/json",
             "content-type": "application/json",
-            "Authorization": f"Bearer {self._token}",
+            "Authorization": f"Bearer {self.token}",
         }
 
 
+# Shared HTTP session so API calls reuse pooled keep-alive connections
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> "requests.Session":
+    """
+    Get the shared requests session.
+
+    The session carries no auth headers, so it is also safe for presigned
+    download URLs; pass headers per request for API calls.
+    """
+    global _session
+    if _session is not None:
+        return _session
+
+    with _session_lock:
+        if _session is not None:
+            return _session
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+
 # Global auth instance for convenience
 _global_auth: Optional[PennsieveAuth] = None
+_global_auth_lock = threading.Lock()
 
 
 def get_auth() -> PennsieveAuth:
     """Get the global auth instance."""
     global _global_auth
     if _global_auth is None:
-        _global_auth = PennsieveAuth()
+        with _global_auth_lock:
+            if _global_auth is None:
+                _global_auth = PennsieveAuth()
     return _global_auth
 
 
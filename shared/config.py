@@ -7,7 +7,28 @@ by specific tool modules (sidecar-generation, dataset-management).
 Override via environment variables where noted.
 """
 
+import logging
 import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _env_seconds(name: str) -> Optional[float]:
+    """
+    Read a number of seconds from an environment variable.
+
+    Returns None when the variable is unset, empty, or not a number; a bad
+    value is warned about rather than failing every entry point at import.
+    """
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring {name}={value!r}: not a number of seconds")
+        return None
 
 
 class BaseConfig:
@@ -22,6 +43,10 @@ class BaseConfig:
     # Cache directory for API responses (override with PENNSIEVE_CACHE_DIR env var)
     CACHE_DIR = os.getenv("PENNSIEVE_CACHE_DIR", "cache")
 
+    # Seconds before a cache file is considered stale; unset means never
+    # (override with PENNSIEVE_CACHE_TTL env var)
+    CACHE_TTL = _env_seconds("PENNSIEVE_CACHE_TTL")
+
     # Output directory for generated files (override with PENNSIEVE_OUTPUT_DIR env var)
     OUTPUT_DIR = os.getenv("PENNSIEVE_OUTPUT_DIR", "output")
 
@@ -32,11 +57,23 @@ class BaseConfig:
         os.makedirs(cls.OUTPUT_DIR, exist_ok=True)
 
 
-# Create directories on import
-BaseConfig.ensure_directories()
+def ensure_dir(path: str) -> str:
+    """
+    Create a directory right before it is written to.
+
+    Not cached: makedirs with exist_ok is cheap, and a directory removed
+    during a long run is recreated on the next write.
+
+    Returns:
+        The path, for convenient chaining
+    """
+    os.makedirs(path, exist_ok=True)
+    return path
+
 
 # Convenience exports for direct import
 API_HOST = BaseConfig.API_HOST
 PAGE_SIZE = BaseConfig.PAGE_SIZE
 CACHE_DIR = BaseConfig.CACHE_DIR
+CACHE_TTL = BaseConfig.CACHE_TTL
 OUTPUT_DIR = BaseConfig.OUTPUT_DIR
@@ -5,29 +5,56 @@ All API functions require authentication via auth.authenticate() before use.
 """
 
 import csv
+import functools
 import io
 import json
 import os
 import re
 import string
-import requests
+import tempfile
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, BinaryIO, Iterator, List, NamedTuple, Optional
 from urllib.parse import quote
 
-from .config import API_HOST, PAGE_SIZE, CACHE_DIR, OUTPUT_DIR
-from .auth import get_headers, get_auth
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+from .config import API_HOST, PAGE_SIZE, CACHE_DIR, CACHE_TTL, OUTPUT_DIR, ensure_dir
+from .auth import get_headers, get_auth, get_session
+
+
+# Concurrent page requests when listing datasets
+MAX_PAGE_WORKERS = 8
 
 
 # =============================================================================
 # API Functions
 # =============================================================================
 
+def _get_datasets_page(offset: int, headers: Dict[str, str]) -> dict:
+    """Fetch one page of the dataset listing."""
+    url = (
+        f"{API_HOST}/datasets/paginated"
+        f"?limit={PAGE_SIZE}&offset={offset}&orderBy=Name&orderDirection=Asc"
+        f"&includeBannerUrl=false&includePublishedDataset=false"
+    )
+    response = get_session().get(url, headers=headers)
+    response.raise_for_status()
+    return response.json()
+
+
 def get_all_datasets(headers: Optional[Dict[str, str]] = None) -> list:
     """
     Paginate through all datasets from Pennsieve API.
 
+    The first page reports totalCount, so the remaining pages are fetched
+    concurrently and joined back in order.
+
     Args:
         headers: Optional custom headers dict. If None, uses global auth via get_headers().
 
@@ -36,98 +63,192 @@ def get_all_datasets(headers: Optional[Dict[str, str]] = None) -> list:
     if headers is None:
         headers = get_headers()
 
-    datasets = []
-    offset = 0
-
-    while True:
-        url = (
-            f"{API_HOST}/datasets/paginated"
-            f"?limit={PAGE_SIZE}&offset={offset}&orderBy=Name&orderDirection=Asc"
-            f"&includeBannerUrl=false&includePublishedDataset=false"
-        )
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+    data = _get_datasets_page(0, headers)
+    datasets = list(data.get("datasets", []))
+    total_count = data.get("totalCount", 0)
 
-        batch = data.get("datasets", [])
-        if not batch:
-            break
+    offsets = range(PAGE_SIZE, total_count, PAGE_SIZE)
+    if not datasets or not offsets:
+        return datasets
 
-        datasets.extend(batch)
-        offset += PAGE_SIZE
-        if offset >= data.get("totalCount", 0):
-            break
+    with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(offsets))) as executor:
+        for page in executor.map(lambda offset: _get_datasets_page(offset, headers), offsets):
+            datasets.extend(page.get("datasets", []))
 
     return datasets
 
 
-def find_dataset_by_name(name: str, all_datasets: list) -> Optional[Dict]:
+def build_dataset_index(all_datasets: list) -> Dict[str, Dict]:
     """
-    Find a dataset by its name.
+    Index datasets by their stripped name.
+
+    The first dataset with a given name wins, matching a front-to-back scan.
 
     Args:
-        name: Dataset name to search for
         all_datasets: List of datasets from get_all_datasets()
 
     Returns:
-        Dataset object if found, None otherwise
+        Dict mapping dataset name to dataset object
     """
+    index: Dict[str, Dict] = {}
     for ds in all_datasets:
-        content = ds.get("content", {})
-        if content.get("name", "").strip() == name:
-            return ds
-    return None
+        name = (ds.get("content") or {}).get("name")
+        if name:
+            index.setdefault(name.strip(), ds)
+    return index
 
 
-def get_dataset_packages(dataset_id: str) -> list:
+# (datasets list, its length, index) from the last find_dataset_by_name call
+_dataset_index_cache: Optional[tuple] = None
+
+
+def find_dataset_by_name(name: str, all_datasets: list) -> Optional[Dict]:
     """
-    Return all packages for a dataset, handling pagination.
+    Find a dataset by its name.
 
-    Requires: auth.authenticate() must be called first.
+    The name index is built once per datasets list, so repeated lookups
+    against the same list are constant time.
+
+    Args:
+        name: Dataset name to search for
+        all_datasets: List of datasets from get_all_datasets()
+
+    Returns:
+        Dataset object if found, None otherwise
     """
+    global _dataset_index_cache
+    cached = _dataset_index_cache
+    if cached is None or cached[0] is not all_datasets or cached[1] != len(all_datasets):
+        cached = (all_datasets, len(all_datasets), build_dataset_index(all_datasets))
+        _dataset_index_cache = cached
+    return cached[2].get(name)
+
+
+def _iter_package_pages(dataset_id: str) -> Iterator[list]:
+    """Yield each page of a dataset's packages, following the cursor."""
     encoded_id = quote(dataset_id, safe="")
     base_url = (
         f"{API_HOST}/datasets/{encoded_id}/packages?"
         f"pageSize=1000&includeSourceFiles=false"
     )
 
-    all_packages = []
     cursor = None
 
     while True:
         url = f"{base_url}&cursor={cursor}" if cursor else base_url
-        response = requests.get(url, headers=get_headers())
+        response = get_session().get(url, headers=get_headers())
         response.raise_for_status()
 
         data = response.json()
-        all_packages.extend(data.get('packages', []))
+        yield data.get('packages', [])
 
         cursor = data.get('cursor')
         if not cursor:
             break
 
+
+def get_dataset_packages(dataset_id: str) -> list:
+    """
+    Return all packages for a dataset, handling pagination.
+
+    Requires: auth.authenticate() must be called first.
+    """
+    all_packages = []
+    for page in _iter_package_pages(dataset_id):
+        all_packages.extend(page)
     return all_packages
 
 
-def get_freq_duration(node_id: str) -> dict:
+def iter_dataset_packages(
+    dataset_id: str,
+    cache_name: str,
+    force_reload: bool = False,
+    max_age: Optional[float] = CACHE_TTL
+) -> Iterator[dict]:
     """
-    Get sampling frequency and duration from an iEEG JSON file.
+    Yield all packages for a dataset, cached as NDJSON (one package per line).
+
+    A cached listing is read back one line at a time. Otherwise each page is
+    written through to the cache as its packages are yielded, so the full
+    listing is never held in memory. The cache only replaces the previous
+    one once every page has been consumed. A cached listing older than
+    max_age seconds (default CACHE_TTL) is refetched.
 
     Requires: auth.authenticate() must be called first.
     """
+    file_path = os.path.join(CACHE_DIR, f"{cache_name}.ndjson")
+
+    f = None if force_reload else _open_cache(file_path, max_age)
+    if f is not None:
+        with f:
+            for line in f:
+                yield _json_loads(line)
+        return
+
+    cache_dir = ensure_dir(CACHE_DIR)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{cache_name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for page in _iter_package_pages(dataset_id):
+                for pkg in page:
+                    f.write(_json_dumps(pkg) + b"\n")
+                    yield pkg
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def get_download_manifests(node_ids: List[str]) -> Dict[str, str]:
+    """
+    Get download URLs for several packages with a single manifest request.
+
+    Requires: auth.authenticate() must be called first.
+
+    Returns:
+        Dict mapping node ID → URL. When a package has several source
+        files, the first one listed is used.
+    """
+    if not node_ids:
+        return {}
+
     url = f"{API_HOST}/packages/download-manifest"
+    payload = {"nodeIds": list(node_ids)}
+
+    response = get_session().post(url, json=payload, headers=get_headers())
+    response.raise_for_status()
 
-    payload = {"nodeIds": [node_id]}
+    # Entries carry their package's nodeId; a lone request needs no matching
+    only_node = node_ids[0] if len(node_ids) == 1 else None
 
-    response = requests.post(url, json=payload, headers=get_headers())
-    response_json = response.json()
-    data = response_json["data"]
+    urls = {}
+    for item in response.json().get("data", []):
+        node_id = item.get("nodeId") or only_node
+        if node_id and item.get("url"):
+            urls.setdefault(node_id, item["url"])
+    return urls
+
+
+def _resolve_download_url(node_id: str, download_url: Optional[str]) -> str:
+    """Return download_url, or request it from the manifest endpoint."""
+    if download_url is None:
+        download_url = get_download_manifests([node_id]).get(node_id)
+    if not download_url:
+        raise ValueError("Manifest response missing 'url' key.")
+    return download_url
 
-    download_url = None
-    for item in data:
-        download_url = item["url"]
 
-    response = requests.get(download_url)
+def get_freq_duration(node_id: str, download_url: Optional[str] = None) -> dict:
+    """
+    Get sampling frequency and duration from an iEEG JSON file.
+
+    Pass download_url (see get_download_manifests) to skip the manifest request.
+
+    Requires: auth.authenticate() must be called first.
+    """
+    download_url = _resolve_download_url(node_id, download_url)
+
+    response = get_session().get(download_url)
     response.raise_for_status()
     ieeg_json = response.json()
 
@@ -137,70 +258,113 @@ def get_freq_duration(node_id: str) -> dict:
     return {"sampling_frequency": sampling_frequency, "duration": duration}
 
 
-def get_electrode_data(node_id: str) -> list:
+def get_electrode_data(node_id: str, download_url: Optional[str] = None) -> list:
     """
     Download and parse electrode CSV data from a package.
 
+    Pass download_url (see get_download_manifests) to skip the manifest request.
+
     Requires: auth.authenticate() must be called first.
     """
-    manifest_url = f"{API_HOST}/packages/download-manifest"
+    download_url = _resolve_download_url(node_id, download_url)
+
+    # Parse rows as the body arrives instead of decoding it to one big string
+    with get_session().get(download_url, stream=True) as file_resp:
+        file_resp.raise_for_status()
+        file_resp.raw.decode_content = True
+        text = io.TextIOWrapper(
+            file_resp.raw,
+            encoding=file_resp.encoding or "utf-8",
+            newline=""
+        )
+        rows = list(csv.DictReader(text))
 
-    payload = {"nodeIds": [node_id]}
+    return rows
 
-    resp = requests.post(manifest_url, json=payload, headers=get_headers())
-    resp.raise_for_status()
 
-    manifest = resp.json()
-    data = manifest.get("data", [])
-    if not data:
-        raise ValueError("No download URLs returned from Pennsieve API.")
+# =============================================================================
+# Caching Functions
+# =============================================================================
 
-    download_url = data[0].get("url")
-    if not download_url:
-        raise ValueError("Manifest response missing 'url' key.")
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
-    file_resp = requests.get(download_url)
-    file_resp.raise_for_status()
 
-    csv_text = file_resp.text
-    reader = csv.DictReader(io.StringIO(csv_text))
-    rows = list(reader)
+def _json_loads(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it's installed."""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
 
-    return rows
 
+def _open_cache(file_path: str, max_age: Optional[float] = CACHE_TTL) -> Optional[BinaryIO]:
+    """
+    Open a cache file for binary reading.
+
+    Returns None if the file is missing or older than max_age seconds. The
+    age comes from fstat on the open file, so a cache hit takes no separate
+    existence check (and no stat at all when max_age is None).
+    """
+    try:
+        f = open(file_path, "rb")
+    except FileNotFoundError:
+        return None
+    if max_age is not None and time.time() - os.fstat(f.fileno()).st_mtime > max_age:
+        f.close()
+        return None
+    return f
 
-# =============================================================================
-# Caching Functions
-# =============================================================================
 
 def save_data(data: Any, name: str) -> None:
-    """Save data to a JSON file in the cache directory."""
-    file_path = os.path.join(CACHE_DIR, f"{name}.json")
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    """
+    Save data to a JSON file in the cache directory.
 
+    The file is written to a temporary name and then moved into place, so
+    readers (including concurrent workers) never see a half-written cache.
+    """
+    cache_dir = ensure_dir(CACHE_DIR)
+    file_path = os.path.join(cache_dir, f"{name}.json")
+    content = _json_dumps(data)
 
-def load_data(name: str, force_reload: bool = False) -> Optional[Any]:
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_data(
+    name: str,
+    force_reload: bool = False,
+    max_age: Optional[float] = CACHE_TTL
+) -> Optional[Any]:
     """
     Load cached data if it exists.
 
     Args:
         name: Cache file name (without .json extension)
         force_reload: If True, bypass cache and return None
+        max_age: Seconds a cache file stays valid (None = forever).
+                 Defaults to CACHE_TTL.
 
     Returns:
-        Cached data or None if not found/force_reload=True
+        Cached data or None if not found, older than max_age, or force_reload=True
     """
     if force_reload:
         return None
 
     file_path = os.path.join(CACHE_DIR, f"{name}.json")
-    if not os.path.exists(file_path):
-        return None
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        f = _open_cache(file_path, max_age)
+        if f is None:
+            return None
+        with f:
+            return _json_loads(f.read())
     except (json.JSONDecodeError, IOError) as e:
         print(f"Warning: Could not load cache ({e})")
         return None
@@ -210,20 +374,28 @@ def load_data(name: str, force_reload: bool = False) -> Optional[Any]:
 # Name Conversion Functions
 # =============================================================================
 
+# First run of digits in a dataset name
+_DIGITS_RE = re.compile(r"(\d+)")
+
+# Old EPS-style dataset name, capturing its number
+_EPS_NAME_RE = re.compile(r"(?i)^EPS[_\s]*(\d+)$")
+
+
 def eps_to_penn_epi(dataset_name: str) -> str:
     """Convert dataset name like 'EPS00049' -> 'PennEPI00049'."""
-    match = re.search(r"(\d+)", dataset_name)
+    match = _DIGITS_RE.search(dataset_name)
     num = match.group(1) if match else "00000"
     return f"PennEPI{int(num):05d}"
 
 
 def penn_epi_to_eps(dataset_name: str) -> str:
     """Convert dataset name like 'PennEPI00049' -> 'EPS0000049'."""
-    match = re.search(r"(\d+)", dataset_name)
+    match = _DIGITS_RE.search(dataset_name)
     num = match.group(1) if match else "0000000"
     return f"EPS{int(num):07d}"
 
 
+@functools.lru_cache(maxsize=4096)
 def generate_new_name(old_name: str) -> str:
     """
     Generate a new PennEPI dataset name from an old EPS-style name.
@@ -234,7 +406,7 @@ def generate_new_name(old_name: str) -> str:
     """
     old_name = old_name.strip()
 
-    match = re.match(r"(?i)^EPS[_\s]*(\d+)$", old_name)
+    match = _EPS_NAME_RE.match(old_name)
     if not match:
         return old_name
 
@@ -248,16 +420,28 @@ def generate_new_name(old_name: str) -> str:
 # String Utilities
 # =============================================================================
 
+# Anything that isn't a word character
+_NON_WORD_RE = re.compile(r"[^\w]")
+
+# Recording-type markers stripped from channel names
+_CHANNEL_MARKER_RE = re.compile(r"(eeg|-ref)")
+
+# Deletes ASCII punctuation via str.translate
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_group_name(name: str) -> str:
     """Strip punctuation and spaces from name for group column."""
-    return re.sub(r"[^\w]", "", name)
+    return _NON_WORD_RE.sub("", name)
 
 
+@functools.lru_cache(maxsize=4096)
 def clean_channel_name(pkg_name: str) -> str:
     """Clean a channel/package name for comparison."""
     name = pkg_name.lower().removesuffix(".mef")
-    name = re.sub(r"(eeg|-ref)", "", name)
-    name = name.translate(str.maketrans("", "", string.punctuation))
+    name = _CHANNEL_MARKER_RE.sub("", name)
+    name = name.translate(_PUNCTUATION_TABLE)
     return name.strip().upper()
 
 
@@ -290,92 +474,156 @@ CHANNEL_CONFIGS = {
     },
 }
 
+
+class ChannelInfo(NamedTuple):
+    """Type and group of a channel. Immutable, so cached results can be shared."""
+    type: str
+    group: str
+
+
 # Build reverse lookup once at module load
-CHANNEL_LOOKUP = {}
+CHANNEL_LOOKUP: Dict[str, ChannelInfo] = {}
 for config_name, config in CHANNEL_CONFIGS.items():
     for channel_name in config["names"]:
-        CHANNEL_LOOKUP[channel_name] = {
-            "type": config["type"],
-            "group": channel_name if config.get("group_strategy") == "use_name"
-                     else config.get("group", "n/a")
-        }
+        CHANNEL_LOOKUP[channel_name] = ChannelInfo(
+            type=config["type"],
+            group=channel_name if config.get("group_strategy") == "use_name"
+                  else config.get("group", "n/a")
+        )
+
 
+# Reference/ground channels, matched case-insensitively
+_UNKNOWN_CHANNEL = ChannelInfo(type="unknown", group="unknown")
+_REF_GND_NAMES = frozenset({"REF", "GND"})
 
-def get_channel_info(channel_name: str) -> dict:
+# Known channels plus REF/GND, so the common case is a single dict probe
+_CHANNEL_TABLE: Dict[str, ChannelInfo] = {
+    **CHANNEL_LOOKUP,
+    **{name: _UNKNOWN_CHANNEL for name in _REF_GND_NAMES},
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def get_channel_info(channel_name: str) -> ChannelInfo:
     """Get type and group for a channel name."""
-    if channel_name.upper() in ["REF", "GND"]:
-        return {"type": "unknown", "group": "unknown"}
+    info = _CHANNEL_TABLE.get(channel_name)
+    if info is not None:
+        return info
 
-    if channel_name in CHANNEL_LOOKUP:
-        return CHANNEL_LOOKUP[channel_name]
+    if channel_name.upper() in _REF_GND_NAMES:
+        return _UNKNOWN_CHANNEL
 
     # Default to SEEG with group = first 2 letters
     group = channel_name[:2] if len(channel_name) >= 2 else channel_name
-    return {"type": "SEEG", "group": group}
+    return ChannelInfo(type="SEEG", group=group)
 
 
 # =============================================================================
 # CSV Parsing Functions
 # =============================================================================
 
-def multi_dataset_read_csv_to_dict(path: Path) -> Dict[str, Dict[str, Any]]:
+def _iter_csv_records(path: Path, key_columns: tuple) -> Iterator[tuple]:
     """
-    Read master CSV and group rows by EPS Number and sub-dataset.
+    Yield (key values, remaining columns) for each row of a CSV file.
 
-    If an EPS has only one sub-dataset, it's flattened into the root.
+    Column positions are resolved once from the header and rows are read
+    with csv.reader, so each row builds just the one dict of kept columns.
+    Missing cells, extra cells and blank lines are handled like DictReader.
     """
-    data: Dict[str, Dict[str, Dict[str, Any]]] = {}
-
     with path.open(newline='', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            eps = (row.get("EPS Number") or "").strip()
-            subdataset = (row.get("Dataset") or "").strip() or "XX"
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        width = len(header)
+        positions = {name: i for i, name in enumerate(header)}
+        key_positions = [positions.get(name) for name in key_columns]
+        kept = [
+            (name, positions[name]) for name in dict.fromkeys(header)
+            if name not in key_columns
+        ]
 
-            if not eps:
+        for row in reader:
+            if not row:
                 continue
+            if len(row) < width:
+                row += [None] * (width - len(row))
+            keys = tuple(row[i] if i is not None else None for i in key_positions)
+            record = {name: row[i] for name, i in kept}
+            if len(row) > width:
+                record[None] = row[width:]
+            yield keys, record
 
-            if eps not in data:
-                data[eps] = {}
 
-            data[eps][subdataset] = {
-                k: v for k, v in row.items() if k not in ("EPS Number", "Dataset")
-            }
+def multi_dataset_read_csv_to_dict(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Read master CSV and group rows by EPS Number and sub-dataset.
 
-    # Flatten EPS entries with only one subdataset
-    flattened: Dict[str, Dict[str, Any]] = {}
-    for eps, subdatasets in data.items():
-        if len(subdatasets) == 1:
-            only_key = next(iter(subdatasets))
-            flattened[eps] = subdatasets[only_key]
-        else:
-            flattened[eps] = subdatasets
+    If an EPS has only one sub-dataset, it's flattened into the root.
+    """
+    data: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
-    return flattened
+    for (eps, subdataset), record in _iter_csv_records(path, ("EPS Number", "Dataset")):
+        eps = (eps or "").strip()
+        if not eps:
+            continue
+        subdataset = (subdataset or "").strip() or "XX"
+        data.setdefault(eps, {})[subdataset] = record
+
+    # Flatten EPS entries with only one subdataset
+    return {
+        eps: next(iter(subdatasets.values())) if len(subdatasets) == 1 else subdatasets
+        for eps, subdatasets in data.items()
+    }
 
 
 def read_csv_to_dict(path: Path) -> Dict[str, Dict[str, Any]]:
     """Read CSV keyed by participant_id."""
     data = {}
-    with path.open(newline='', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            eps = row.get("participant_id")
-            if not eps:
-                continue
-            data[eps.strip()] = {k: v for k, v in row.items() if k != "participant_id"}
+    for (eps,), record in _iter_csv_records(path, ("participant_id",)):
+        if not eps:
+            continue
+        data[eps.strip()] = record
     return data
 
 
+def _iter_electrode_lines(data) -> Iterator[str]:
+    """
+    Yield the text lines held in parse_electrode_txt's input.
+
+    A list input is what get_electrode_data returns for a headerless TSV:
+    one dict per row, all sharing the first line as their key. Each
+    distinct key is yielded once rather than once per row.
+    """
+    if isinstance(data, str):
+        yield from data.strip().splitlines()
+        return
+
+    if not isinstance(data, list):
+        return
+
+    seen_keys = set()
+    for entry in data:
+        if isinstance(entry, dict):
+            for k, v in entry.items():
+                if k not in seen_keys:
+                    seen_keys.add(k)
+                    yield k
+                yield v
+        elif isinstance(entry, str):
+            yield entry
+
+
 def parse_electrode_txt(data) -> Dict[str, Dict[str, Any]]:
     """Parse electrode text data into a dictionary keyed by label."""
+    result = {}
 
-    def parse_line(line):
-        parts = line.split("\t")
+    for line in _iter_electrode_lines(data):
+        parts = line.split("\t", 6)
         if len(parts) < 6:
-            return None
-        return {
-            "label": parts[0],
+            continue
+        result[parts[0]] = {
             "x": float(parts[1]),
             "y": float(parts[2]),
             "z": float(parts[3]),
@@ -383,30 +631,4 @@ def parse_electrode_txt(data) -> Dict[str, Dict[str, Any]]:
             "group": parts[5]
         }
 
-    parsed = []
-
-    if isinstance(data, str):
-        lines = data.strip().splitlines()
-        for line in lines:
-            item = parse_line(line)
-            if item:
-                parsed.append(item)
-
-    elif isinstance(data, list):
-        for entry in data:
-            if isinstance(entry, dict):
-                for k, v in entry.items():
-                    for line in (k, v):
-                        item = parse_line(line)
-                        if item:
-                            parsed.append(item)
-            elif isinstance(entry, str):
-                item = parse_line(entry)
-                if item:
-                    parsed.append(item)
-
-    result = {
-        item["label"]: {k: v for k, v in item.items() if k != "label"}
-        for item in parsed
-    }
     return result
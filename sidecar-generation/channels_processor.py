@@ -9,7 +9,9 @@ import argparse
 import csv
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 # Set up import paths - local first, then parent for shared package
 _this_dir = Path(__file__).parent
@@ -17,12 +19,12 @@ sys.path.insert(0, str(_this_dir))
 sys.path.insert(1, str(_this_dir.parent))
 
 from shared.helpers import (
-    load_data, save_data, get_all_datasets, get_dataset_packages,
-    get_freq_duration, get_electrode_data, parse_electrode_txt,
+    load_data, save_data, get_all_datasets, iter_dataset_packages,
+    get_download_manifests, get_freq_duration, get_electrode_data, parse_electrode_txt,
     eps_to_penn_epi, penn_epi_to_eps, clean_channel_name,
     get_channel_info, sanitize_group_name
 )
-from shared.config import OUTPUT_DIR
+from shared.config import OUTPUT_DIR, CACHE_TTL
 from config import MASTER_CSV_PATH
 from sidecars import ChannelsSidecar
 
@@ -34,6 +36,21 @@ from sidecars import ChannelsSidecar
 MULTI_DAY_KEYS = ["D01", "D02", "D03", "D04", "D05", "D06", "D07"]
 SKIP_DATASETS = {"PennEPI00949"}
 
+# Datasets processed concurrently; the work is almost all waiting on HTTP
+MAX_DATASET_WORKERS = 16
+
+# Concurrent file downloads across all datasets (the HTTP session keeps 32 connections)
+MAX_DOWNLOAD_WORKERS = 32
+
+# One download pool shared by every dataset worker, so the total number of
+# in-flight downloads stays within the session's connection pool
+_download_executor = ThreadPoolExecutor(
+    max_workers=MAX_DOWNLOAD_WORKERS, thread_name_prefix="download"
+)
+
+# Package types whose file contents are downloaded and cached
+DOWNLOADED_TYPES = {"ieeg_json", "electrodes_csv", "electrodes_txt"}
+
 
 # =============================================================================
 # Package Classification Helpers
@@ -89,44 +106,75 @@ def get_ref_gnd_map(csv_path: str) -> dict:
     return mapping
 
 
-def load_ieeg_metadata(node_id: str, force_reload: bool = False) -> dict:
-    """Load sampling frequency and duration from ieeg.json file."""
-    cache_key = f"ieeg_json_data_{node_id}"
-    data = load_data(cache_key, force_reload=force_reload)
+def package_cache_key(pkg_type: str, node_id: str, dataset_name: str) -> str:
+    """Cache key for a downloaded ieeg.json or electrode file."""
+    if pkg_type == "ieeg_json":
+        return f"ieeg_json_data_{node_id}"
+    if pkg_type == "electrodes_csv":
+        return f"electrode_data_{dataset_name}"
+    return f"electrode_txt_data_{dataset_name}"
+
 
-    if data is None:
-        print(f"  Fetching ieeg.json metadata...")
-        data = get_freq_duration(node_id)
-        save_data(data, cache_key)
+def download_package_file(pkg_type: str, node_id: str, download_url: str = None):
+    """Download and parse one ieeg.json or electrode file."""
+    if pkg_type == "ieeg_json":
+        return get_freq_duration(node_id, download_url)
 
+    data = get_electrode_data(node_id, download_url)
+    if pkg_type == "electrodes_txt":
+        data = parse_electrode_txt(data)
     return data
 
 
-def load_electrode_csv(node_id: str, dataset_name: str, force_reload: bool = False) -> list:
-    """Load electrode data from CSV file."""
-    cache_key = f"electrode_data_{dataset_name}"
-    data = load_data(cache_key, force_reload=force_reload)
+def load_package_files(
+    classified: list,
+    dataset_name: str,
+    force_reload: bool = False,
+    max_age: Optional[float] = CACHE_TTL
+) -> dict:
+    """
+    Load ieeg.json metadata and electrode data for a dataset's packages.
+
+    `classified` holds (package content, package type) pairs.
+
+    Files found in the cache are read from disk. The rest get their URLs
+    from one download-manifest request and are downloaded concurrently on
+    the shared download pool.
 
-    if data is None:
-        print(f"  Fetching electrode CSV data...")
-        data = get_electrode_data(node_id)
-        save_data(data, cache_key)
+    Returns:
+        Dict mapping cache key → loaded data
+    """
+    wanted = {}
+    for pkg_content, pkg_type in classified:
+        if pkg_type in DOWNLOADED_TYPES:
+            node_id = pkg_content.get("nodeId")
+            key = package_cache_key(pkg_type, node_id, dataset_name)
+            wanted.setdefault(key, (pkg_type, node_id))
+
+    loaded = {}
+    missing = []
+    for key, (pkg_type, node_id) in wanted.items():
+        data = load_data(key, force_reload=force_reload, max_age=max_age)
+        if data is None:
+            missing.append((key, pkg_type, node_id))
+        else:
+            loaded[key] = data
 
-    return data
+    if not missing:
+        return loaded
 
+    print(f"[{dataset_name}] Fetching {len(missing)} metadata file(s)...")
+    urls = get_download_manifests([node_id for _, _, node_id in missing])
 
-def load_electrode_txt(node_id: str, dataset_name: str, force_reload: bool = False) -> dict:
-    """Load electrode data from TXT file."""
-    cache_key = f"electrode_txt_data_{dataset_name}"
-    data = load_data(cache_key, force_reload=force_reload)
+    def fetch(item: tuple) -> tuple:
+        key, pkg_type, node_id = item
+        data = download_package_file(pkg_type, node_id, urls.get(node_id))
+        save_data(data, key)
+        return key, data
 
-    if data is None:
-        print(f"  Fetching electrode TXT data...")
-        raw_data = get_electrode_data(node_id)
-        data = parse_electrode_txt(raw_data)
-        save_data(data, cache_key)
+    loaded.update(_download_executor.map(fetch, missing))
 
-    return data
+    return loaded
 
 
 # =============================================================================
@@ -151,13 +199,13 @@ def build_channel_row(
     # Build row - ChannelsSidecar will apply defaults for missing fields
     row = {
         "name": channel_name,
-        "type": channel_info["type"],
+        "type": channel_info.type,
         "units": "uV",
         "low_cutoff": "n/a",
         "high_cutoff": "0.01" if not is_ekg else "n/a",
         "reference": "unknown" if is_ekg else reference,
         "ground": "unknown" if is_ekg else ground,
-        "group": channel_info["group"],
+        "group": channel_info.group,
         "sampling_frequency": sampling_freq,
         "notch": "n/a",
     }
@@ -194,47 +242,49 @@ def get_output_path(dataset_name: str, parent_key: str = None) -> Path:
 # Main Processing Functions
 # =============================================================================
 
-def build_parent_id_ref(
-    datasets: list,
+def classify_packages(
+    packages,
+    dataset_name: str,
     payload: dict,
-    parent_id_reference: dict,
-    force_reload: bool = False
-) -> None:
+    parent_id_reference: dict
+) -> list:
     """
-    Build parent ID reference mapping for multi-day datasets.
+    Record multi-day parents and classify a dataset's packages in one pass.
+
+    Packages named D0x are mapped from their ID to the day key (D01, D02,
+    etc.) in parent_id_reference, with an entry for each day in the payload.
 
-    This maps package IDs to sub-dataset keys (D01, D02, etc.) for datasets
-    that have multiple recording days.
+    Returns:
+        List of (package content, package type) for live packages of a known type
     """
-    for ds in datasets:
-        dataset_name = ds["content"]["name"]
-        ds_id = ds["content"]["id"]
+    classified = []
 
-        payload[dataset_name] = {}
-        parent_id_reference[dataset_name] = {}
+    for pkg in packages:
+        pkg_content = pkg.get("content", {})
+        pkg_name = pkg_content.get("name", "")
 
-        packages = load_data(f"package_{dataset_name}", force_reload=force_reload)
-        if packages is None:
-            packages = get_dataset_packages(ds_id)
-            save_data(packages, f"package_{dataset_name}")
-
-        for pkg in packages:
-            pkg_content = pkg.get("content", {})
-            pkg_name = pkg_content.get("name", "")
-
-            if pkg_name.lower().strip().startswith("d0"):
-                # Multi-day dataset: map package ID to day key
-                parent_id_reference[dataset_name][pkg_content.get("id", "")] = pkg_name
-                payload[dataset_name][pkg_name] = {
-                    "sampling_frequency": None,
-                    "duration": None,
-                }
-            else:
-                # Single dataset
-                payload[dataset_name].update({
-                    "sampling_frequency": None,
-                    "duration": None,
-                })
+        if pkg_name.lower().strip().startswith("d0"):
+            # Multi-day dataset: map package ID to day key
+            parent_id_reference[dataset_name][pkg_content.get("id", "")] = pkg_name
+            payload[dataset_name][pkg_name] = {
+                "sampling_frequency": None,
+                "duration": None,
+            }
+        else:
+            # Single dataset
+            payload[dataset_name].update({
+                "sampling_frequency": None,
+                "duration": None,
+            })
+
+        if is_deleted(pkg_content):
+            continue
+
+        pkg_type = classify_package(pkg_name)
+        if pkg_type is not None:
+            classified.append((pkg_content, pkg_type))
+
+    return classified
 
 
 def process_dataset(
@@ -242,37 +292,41 @@ def process_dataset(
     master_map: dict,
     payload: dict,
     parent_id_reference: dict,
-    force_reload: bool = False
+    force_reload: bool = False,
+    max_age: Optional[float] = CACHE_TTL
 ) -> None:
     """
     Process a single dataset to generate channels.tsv files.
 
     This function:
-    1. Loads packages and classifies them by type
-    2. Extracts metadata from ieeg.json and electrode files
+    1. Loads packages, records multi-day parents and classifies packages by type
+    2. Fetches ieeg.json and electrode files with one batched manifest request
     3. Builds channel rows from .mef files
     4. Writes channels.tsv using ChannelsSidecar
     """
     dataset_name = ds["content"]["name"]
     ds_id = ds["content"]["id"]
 
+    payload.setdefault(dataset_name, {})
+    parent_id_reference.setdefault(dataset_name, {})
+
     print(f"Processing: {dataset_name}")
 
     # Skip invalid datasets
     if dataset_name in SKIP_DATASETS:
-        print(f"  Skipping (in skip list)")
+        print(f"[{dataset_name}] Skipping (in skip list)")
         return
 
     if not is_valid_dataset_name(dataset_name):
-        print(f"  Skipping (not EPS/PennEPI)")
+        print(f"[{dataset_name}] Skipping (not EPS/PennEPI)")
         return
 
-    # Load packages
-    packages = load_data(f"package_{dataset_name}", force_reload=force_reload)
-    if packages is None:
-        print(f"  Fetching packages from network...")
-        packages = get_dataset_packages(ds_id)
-        save_data(packages, f"package_{dataset_name}")
+    # Stream packages from the cache (or the network, filling the cache)
+    packages = iter_dataset_packages(ds_id, f"package_{dataset_name}", force_reload, max_age)
+    classified = classify_packages(packages, dataset_name, payload, parent_id_reference)
+
+    # Fetch every ieeg.json and electrode file up front (electrode data is only cached)
+    package_files = load_package_files(classified, dataset_name, force_reload, max_age)
 
     # Get reference/ground from master map
     master_map_key = penn_epi_to_eps(dataset_name)
@@ -285,25 +339,15 @@ def process_dataset(
     # Collect channel rows by parent ID
     rows_by_parent = {}
 
-    # Single pass through packages
-    for pkg in packages:
-        pkg_content = pkg.get("content", {})
-
-        if is_deleted(pkg_content):
-            continue
-
+    # Walk packages in listing order, using the files fetched above
+    for pkg_content, pkg_type in classified:
         pkg_name = pkg_content.get("name", "")
-        pkg_type = classify_package(pkg_name)
-
-        if pkg_type is None:
-            continue
-
         node_id = pkg_content.get("nodeId")
         parent_id = pkg_content.get("parentId")
 
         # Handle ieeg.json - extract sampling frequency
         if pkg_type == "ieeg_json":
-            metadata = load_ieeg_metadata(node_id, force_reload)
+            metadata = package_files[package_cache_key(pkg_type, node_id, dataset_name)]
             sampling_freq = metadata.get("sampling_frequency", "n/a")
             duration = metadata.get("duration", "n/a")
 
@@ -318,13 +362,6 @@ def process_dataset(
                 payload[dataset_name]["sampling_frequency"] = sampling_freq
                 payload[dataset_name]["duration"] = duration
 
-        # Handle electrode files - just cache them for later use
-        elif pkg_type == "electrodes_csv":
-            load_electrode_csv(node_id, dataset_name, force_reload)
-
-        elif pkg_type == "electrodes_txt":
-            load_electrode_txt(node_id, dataset_name, force_reload)
-
         # Handle .mef files - build channel rows
         elif pkg_type == "mef":
             # Get sampling frequency for this parent
@@ -354,17 +391,26 @@ def process_dataset(
         # Use ChannelsSidecar to write the file
         sidecar = ChannelsSidecar(rows=rows)
         sidecar.save(output_path=str(output_path))
-        print(f"  Wrote {len(rows)} channels → {output_path.name}")
+        print(f"[{dataset_name}] Wrote {len(rows)} channels → {output_path.name}")
 
 
-def make_channels(force_reload: bool = False) -> None:
+def make_channels(
+    force_reload: bool = False,
+    workers: int = MAX_DATASET_WORKERS,
+    max_age: Optional[float] = CACHE_TTL
+) -> None:
     """
     Main entry point: generate channels.tsv for all datasets.
+
+    Each dataset only touches its own payload and parent ID entries, so
+    datasets are fetched and processed on a thread pool of `workers`.
+    Cached API responses younger than `max_age` seconds are reused without
+    any network requests (None keeps them forever).
     """
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     print("Fetching all datasets...")
-    datasets = load_data("datasets", force_reload=force_reload)
+    datasets = load_data("datasets", force_reload=force_reload, max_age=max_age)
     if datasets is None:
         print("Fetching datasets from network...")
         datasets = get_all_datasets()
@@ -375,16 +421,22 @@ def make_channels(force_reload: bool = False) -> None:
     # Load reference/ground mapping
     master_map = get_ref_gnd_map(MASTER_CSV_PATH)
 
-    # Initialize tracking structures
+    # Create every dataset's entries up front so workers only fill in their own
     payload = {}
     parent_id_reference = {}
-
-    # Build parent ID reference for multi-day datasets
-    build_parent_id_ref(datasets, payload, parent_id_reference, force_reload)
+    for ds in datasets:
+        dataset_name = ds["content"]["name"]
+        payload[dataset_name] = {}
+        parent_id_reference[dataset_name] = {}
 
     # Process each dataset
-    for ds in datasets:
-        process_dataset(ds, master_map, payload, parent_id_reference, force_reload)
+    def process_one(ds: dict) -> None:
+        process_dataset(
+            ds, master_map, payload, parent_id_reference, force_reload, max_age
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(process_one, datasets))
 
     # Save final payload
     save_data(payload, "payload")
@@ -402,9 +454,26 @@ if __name__ == "__main__":
         action='store_true',
         help='Force reload all data from network, bypassing cache'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=MAX_DATASET_WORKERS,
+        help=f'Datasets to process concurrently (default: {MAX_DATASET_WORKERS})'
+    )
+    parser.add_argument(
+        '--max-age',
+        type=float,
+        default=CACHE_TTL,
+        help='Refetch cached API data older than this many seconds '
+             '(default: PENNSIEVE_CACHE_TTL, or never)'
+    )
     args = parser.parse_args()
 
     if args.force_reload:
         print("Force reload enabled - all data will be fetched from network")
 
-    make_channels(force_reload=args.force_reload)
+    make_channels(
+        force_reload=args.force_reload,
+        workers=args.workers,
+        max_age=args.max_age
+    )
@@ -1,6 +1,10 @@
 import csv
+import functools
 import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 
@@ -33,6 +37,17 @@ POWER_LINE_FREQUENCY = 60
 SOFTWARE_FILTERS = "n/a"
 RECORDING_TYPE = "discontinuous"
 
+# channels.tsv type → ieeg.json channel count field (any other type counts as Misc)
+CHANNEL_COUNT_KEYS = {
+    "ecog": "ECOGChannelCount",
+    "seeg": "SEEGChannelCount",
+    "eeg": "EEGChannelCount",
+    "eog": "EOGChannelCount",
+    "ecg": "ECGChannelCount",
+    "emg": "EMGChannelCount",
+    "trig": "TriggerChannelCount",
+}
+
 # Participant constants
 SPECIES = "Homo sapiens"
 POPULATION = "adult"
@@ -44,17 +59,20 @@ MASTER_SUBJECT_METADATA = str(_this_dir / "data" / "subject_metadata.csv")
 # Naming
 PREFIX = "PennEPI"
 
+# Everything but digits; rename() keeps every digit in a name
+_NON_DIGITS_RE = re.compile(r"\D+")
+
+# Datasets whose sidecars are generated concurrently (the work is file IO)
+MAX_DATASET_WORKERS = 8
+
 from sidecars import (
     DatasetDescriptionSidecar,
     SessionSidecar,
     ParticipantsSidecar,
     ParticipantsSideCarTSV,
     IeegSidecar,
-    ChannelsSidecar,
     CoordSystemSidecar,
     ElectrodesSidecar,
-    EEGSidecar,
-    EventsSidecar,
 )
 from channels_processor import make_channels
 
@@ -62,7 +80,14 @@ DATASET_RUN = ["PennEPI00006"]
 
 data_map = {}
 
+@functools.lru_cache(maxsize=None)
+def _cached_load(name):
+    """Load a cache file once per run. The result is shared, so don't mutate it."""
+    return load_data(name)
+
 def createEventsSidecar(name,data_map):
+    from sidecars import EventsSidecar
+
     events_data = [
             {
                 "onset": 0.0,
@@ -93,6 +118,8 @@ def createEventsSidecar(name,data_map):
     sidecar.save(data=events_data, output_dir=f"output/{name}/bids")
 
 def createEEGSidecar(name,data_map):
+    from sidecars import EEGSidecar
+
     eeg_fields = {
             "TaskName": "RestingState",
             "EEGReference": "Cz",
@@ -112,31 +139,29 @@ def createEEGSidecar(name,data_map):
     eeg_sidecar.save(output_dir=f"output/{name}/bids", json_indent=4)
 
 def createElectrodesSidecar(name):
-
-    electrodes_payload = []
     electrode_data = load_data(f"electrode_data_{name}", True)
     electrode_text = load_data(f"electrode_txt_data_{name}",True)
 
     if electrode_data != None:
-        for data in electrode_data:
-            label = data.get("labels","")
-            raw_dimensions = electrode_text[label]["group"]
-            dimensions = raw_dimensions.split(" ")
-            dimension = f"{dimensions[1]}x{dimensions[0]}"
-
-            electrodes_payload.append({
+        electrodes_payload = [
+            {
                 "name": label,
                 "x": data.get("mm_x",""),
                 "y": data.get("mm_y",""),
                 "z": data.get("mm_z",""),
                 "size": ELECTRODES_SIZE,
                 "manufacturer": ELECTRODES_MANUFACTURER,
-                "group": label[:2].upper(),
-                "hemisphere": label[0].upper(),
+                "group": group,
+                "hemisphere": group[0],
                 "type": ELECTRODES_GROUP,
-                "dimension": dimension,
+                "dimension": f"{dimensions[1]}x{dimensions[0]}",
                 "roi": data.get("roi",""),
-            })
+            }
+            for data in electrode_data
+            for label in (data.get("labels",""),)
+            for group in (label[:2].upper(),)
+            for dimensions in (electrode_text[label]["group"].split(" "),)
+        ]
         sidecar = ElectrodesSidecar(filename=f"sub-{name}_ses-postimplant_space-MNI152NLin6ASym_electrodes.tsv")
         sidecar.save(data=electrodes_payload, output_dir=f"output/{name}/primary/sub-{name}/ses-postimplant/ieeg")
         return True
@@ -158,6 +183,8 @@ def createCoordsSidecar(name):
     sidecar.save(output_dir=f"output/{name}/primary/sub-{name}/ses-postimplant/ieeg", json_indent=4)
 
 def createChannelsDataSidecar(name,data_map):
+    from sidecars import ChannelsSidecar
+
     channels_data = [
             {
                 "name": "EKG1",
@@ -216,14 +243,8 @@ def createIEEGDataSidecar(name,key,data_map):
             "SamplingFrequency": sampling_frquency, # TODO: Not being pulled 
             "PowerLineFrequency": POWER_LINE_FREQUENCY, # ok
             "SoftwareFilters": SOFTWARE_FILTERS,  # ok
-            "ECOGChannelCount": channel_counts["ECOGChannelCount"],  # ok
-            "SEEGChannelCount": channel_counts["SEEGChannelCount"],  # ok
-            "EEGChannelCount": channel_counts["EEGChannelCount"],  # ok
-            "EOGChannelCount": channel_counts["EOGChannelCount"],  # ok
-            "ECGChannelCount": channel_counts["ECGChannelCount"],  # ok
-            "EMGChannelCount": channel_counts["EMGChannelCount"],  # ok
-            "MiscChannelCount": channel_counts["MiscChannelCount"],  # ok
-            "TriggerChannelCount": channel_counts["TriggerChannelCount"],  # TODO: Confirm
+            # ECOG/SEEG/EEG/EOG/ECG/EMG/Misc/TriggerChannelCount, in that order
+            **channel_counts,  # ok (TODO: Confirm TriggerChannelCount)
             "RecordingDuration": recording_duration, # TODO: Not being pulled
             "RecordingType": RECORDING_TYPE, # ok
             "HardwareFilters":{
@@ -237,19 +258,9 @@ def createIEEGDataSidecar(name,key,data_map):
         sidecar = IeegSidecar(ieeg_data, filename=f"sub-{name}_ses-postimplant_task-clinical_ieeg.json")
         sidecar.save(output_dir=path)
 
-    def get_sampling_frequency(path):
-        # Get Sampling Frequency and Recording duration
-        try:
-            with open(path) as f:
-                reader = csv.DictReader(f, delimiter="\t")
-                row = next(reader)
-                return row.get("sampling_frequency", "n/a")
-        except FileNotFoundError:
-            return "n/a"
-        
     def get_recording_duration(key, sub_key=None):
         eps_key = eps_to_penn_epi(key)
-        payload = load_data("payload")
+        payload = _cached_load("payload")
         try:
             if sub_key == None:
                 return payload[eps_key]["duration"]
@@ -258,7 +269,9 @@ def createIEEGDataSidecar(name,key,data_map):
         except KeyError as e:
             return -1
         
-    def get_channel_counts(path):
+    def read_channels_stats(path):
+        """Read the sampling frequency (first row) and per-type channel counts in one pass."""
+        sampling_frequency = "n/a"
         counts = {
             "ECOGChannelCount": 0,
             "SEEGChannelCount": 0,
@@ -271,49 +284,49 @@ def createIEEGDataSidecar(name,key,data_map):
         }
         try:
             with open(path) as f:
-                reader = csv.DictReader(f,delimiter="\t")
-                for line in reader:
-                    if line["type"].lower().strip() == "ecog":
-                        counts["ECOGChannelCount"] +=1
-                    elif line["type"].lower().strip() == "seeg":
-                        counts["SEEGChannelCount"] +=1
-                    elif line["type"].lower().strip() == "eeg":
-                        counts["EEGChannelCount"] +=1
-                    elif line["type"].lower().strip() == "eog":
-                        counts["EOGChannelCount"] +=1
-                    elif line["type"].lower().strip() == "ecg":
-                        counts["ECGChannelCount"] +=1
-                    elif line["type"].lower().strip() == "emg":
-                        counts["EMGChannelCount"] +=1
-                    elif line["type"].lower().strip() == "trig":
-                        counts["TriggerChannelCount"] +=1
-                    else:
-                        counts["MiscChannelCount"] +=1
+                reader = csv.reader(f, delimiter="\t")
+                header = next(reader, [])
+                rows = [row for row in reader if row]
         except FileNotFoundError:
-            return counts
+            return sampling_frequency, counts
+
+        if rows and "sampling_frequency" in header:
+            sampling_frequency = rows[0][header.index("sampling_frequency")]
 
-        return counts
+        if "type" in header:
+            type_idx = header.index("type")
+            # Tally raw values first so each distinct type is normalized once
+            raw_counts = Counter(row[type_idx] for row in rows)
+            for raw_type, n in raw_counts.items():
+                count_key = CHANNEL_COUNT_KEYS.get(raw_type.lower().strip(), "MiscChannelCount")
+                counts[count_key] += n
+
+        return sampling_frequency, counts
+
+    # Path fragments shared by every sub-dataset of this subject
+    subject_dir = os.path.join(OUTPUT_DIR, name)
+    ieeg_rel = os.path.join(f"sub-{name}", "ses-postimplant", "ieeg")
+    channels_file = f"sub-{name}_ses-postimplant_task-clinical_channels.tsv"
+
+    # Subjects missing from the hardware metadata still get an ieeg.json of "n/a"s
+    subject_data = data_map.get(key) or {}
 
     # detect if this EPS has subdatasets (D01, D02, ...)
-    if any(k.startswith("D0") for k in data_map.get(key).keys()):
-        for sub_key, sub_data in data_map.get(key).items():
-            if not sub_key.startswith("D0"):
-                continue
-
-            path = f"{OUTPUT_DIR}/{name}/primary/{sub_key}/sub-{name}/ses-postimplant/ieeg"
-            channels_path = os.path.join(OUTPUT_DIR, name, sub_key, "primary", f"sub-{name}", "ses-postimplant", "ieeg", f"sub-{name}_ses-postimplant_task-clinical_channels.tsv")
-            sampling_frquency = get_sampling_frequency(channels_path)
+    sub_keys = [k for k in subject_data if k.startswith("D0")]
+    if sub_keys:
+        for sub_key in sub_keys:
+            path = os.path.join(subject_dir, "primary", sub_key, ieeg_rel)
+            channels_path = os.path.join(subject_dir, sub_key, "primary", ieeg_rel, channels_file)
+            sampling_frquency, channel_counts = read_channels_stats(channels_path)
             recording_duration = get_recording_duration(key,sub_key)
-            channel_counts = get_channel_counts(channels_path)
 
-            save_ieeg_sidecar(name, sampling_frquency, recording_duration, channel_counts, data_map.get(key),path)
+            save_ieeg_sidecar(name, sampling_frquency, recording_duration, channel_counts, subject_data,path)
     else:
-        path = f"{OUTPUT_DIR}/{name}/primary/sub-{name}/ses-postimplant/ieeg"
-        channels_path = os.path.join(OUTPUT_DIR, name,"primary",f"sub-{name}", "ses-postimplant", "ieeg", f"sub-{name}_ses-postimplant_task-clinical_channels.tsv")
-        sampling_frquency = get_sampling_frequency(channels_path)
+        path = os.path.join(subject_dir, "primary", ieeg_rel)
+        channels_path = os.path.join(path, channels_file)
+        sampling_frquency, channel_counts = read_channels_stats(channels_path)
         recording_duration = get_recording_duration(key)
-        channel_counts = get_channel_counts(channels_path)
-        save_ieeg_sidecar(name, sampling_frquency, recording_duration, channel_counts, data_map.get(key),path)   
+        save_ieeg_sidecar(name, sampling_frquency, recording_duration, channel_counts, subject_data,path)
 
 def createSessionsDataSidecar(name,key,data_map):
     
@@ -350,204 +363,208 @@ def createSessionsDataSidecar(name,key,data_map):
     session_sidecar.save(data=sessions_data, output_dir=f"output/{name}/primary/sub-{name}")
 
 def createParticipantsTSVSidecar(name,key,data_map):
-    print(data_map)
-    try:
-        sex = data_map[name].get("sex","n/a")
-    except KeyError as e:
-        sex = "n/a"
+    subject = data_map.get(name) or {}
     pariticpant_data = [
             {
                 "participant_id": f"sub-{name}",
                 "species": SPECIES,
                 "population": POPULATION,
-                "sex": sex, 
-                "MRI_lesion":data_map[name].get("mri_lesion","n/a"),
-                "MRI_lesionType": data_map[name].get("mri_lesionType","n/a"),
-                'MRI_lesionDetails':data_map[name].get("mri_lesionDetails","n/a"),
-                "ieeg_isFocal": data_map[name].get("ieeg_isFocal","n/a"),
-                "age_intervention": data_map[name].get("age_intervention","n/a"),
-                "intervention_type": data_map[name].get("intervention_type","n/a"),
-                "intervention_location":data_map[name].get("intervention_location","n/a"),
-                "seizure_Engel12m":data_map[name].get("seizure_Engel12m","n/a"),
-                "seizure_Engel24m":data_map[name].get("seizure_Engel24m","n/a"),
-                "fiveSenseScore":data_map[name].get("fiveSenseScore","n/a"),
+                "sex": subject.get("sex","n/a"),
+                "MRI_lesion":subject.get("mri_lesion","n/a"),
+                "MRI_lesionType": subject.get("mri_lesionType","n/a"),
+                'MRI_lesionDetails':subject.get("mri_lesionDetails","n/a"),
+                "ieeg_isFocal": subject.get("ieeg_isFocal","n/a"),
+                "age_intervention": subject.get("age_intervention","n/a"),
+                "intervention_type": subject.get("intervention_type","n/a"),
+                "intervention_location":subject.get("intervention_location","n/a"),
+                "seizure_Engel12m":subject.get("seizure_Engel12m","n/a"),
+                "seizure_Engel24m":subject.get("seizure_Engel24m","n/a"),
+                "fiveSenseScore":subject.get("fiveSenseScore","n/a"),
             },
 
         ]
     pariticpant_sidecar = ParticipantsSideCarTSV(filename=f"participants.tsv")
     pariticpant_sidecar.save(data=pariticpant_data, output_dir=f"output/{name}")
 
+# participants.json column descriptions (identical for every dataset)
+PARTICIPANTS_SCHEMA = {
+    "participant_id": {
+        "Description": "Unique participant identifier"
+    },
+    "species": {
+        "Description": "Species of the participant",
+        "Levels": {
+            "homo sapiens": "Human"
+        }
+    },
+    "population": {
+        "Description": "Adult or pediatric population classification",
+        "Levels": {
+            "adult": "adult",
+            "pediatric": "pediatric"
+        }
+    },
+    "sex": {
+        "Description": "Biological sex of the subject, collected from health record",
+        "Levels": {
+            "Female": "Female",
+            "Male": "Male"
+        }
+    },
+    "MRI_lesion": {
+        "Description": "Preimplant MRI lesion status",
+        "Levels": {
+            "lesional": "lesional",
+            "nonlesional": "nonlesional",
+            "n/a": "not available"
+        }
+    },
+    "MRI_lesionType": {
+        "Description": "Type of MRI lesion",
+        "Levels": {
+            "Encephalocele": "Encephalocele",
+            "FCD": "Focal Cortical Dysplasia",
+            "MTS": "Medial Temporal Sclerosis",
+            "Multiple": "see MRI_lesionDetails for description",
+            "Prior surgery": "prior resection",
+            "PVNH": "periventricular nodular heterotopia",
+            "Tubers": "Tubers",
+            "n/a": "nonlesional",
+            "Other": "see MRI_lesionDetails for description"
+        }
+    },
+    "MRI_lesionDetails": {
+        "Description": "Type of MRI lesion, specified",
+    },
+    "ieeg_isFocal": {
+        "Description": "Postimplant determination of seizure onset focality",
+        "Levels": {
+            "focal": "focal",
+            "nonfocal": "nonfocal"
+        }
+    },
+    "age_intervention":{
+        "Description": "Age of subject at postimplant surgical intervention",
+        "Units": "years"
+    },
+    "intervention_type": {
+        "Description": "Postimplant intervention, associated data in postsurgery session if applicable",
+        "Levels": {
+        "ablation": "laser ablation",
+        "DBS": "Deep brain stimulation device",
+        "medication": "medication management, no surgical intervention post iEEG implant",
+        "resection": "resection",
+        "RNS": "Responsive neurostimulation (NeuroPace RNS System)",
+        "VNS": "Vagal nerve stimulator device"
+        }
+    },
+    "intervention_side": {
+        "Description": "Hemisphere of surgical intervention",
+        "Levels": {
+            "Bilateral": "Bilateral",
+            "Left": "Left",
+            "Right": "Right",
+            "n/a": "no surgical intervention"
+        }
+    },
+    "intervention_location": {
+        "Description": "Brain region of surgical intervention",
+    },
+    "seizure_Engel12m": {
+        "Description": "Engel outcome classification 12 months post-surgical intervention; integer represents roman numeral classes and .1 = A, .2 = B, .3 = C, .4 = D",
+        "Reference": "Wieser HG, Blume WT, Fish D, Goldensohn E, Hufnagel A, King D, Sperling MR, Lüders H, Pedley TA; Commission on Neurosurgery of the International League Against Epilepsy (ILAE). ILAE Commission Report. Proposal for a new classification of outcome with respect to epileptic seizures following epilepsy surgery. Epilepsia. 2001 Feb;42(2):282-6. PMID: 11240604.",
+        "Units": "number class",
+    },
+    "seizure_Engel24m": {
+            "Description": "Engel outcome classification 24 months postsurgical intervention; integer represents roman numeral classes and .1 = A, .2 = B, .3 = C, .4 = D",
+            "Reference": "Wieser HG, Blume WT, Fish D, Goldensohn E, Hufnagel A, King D, Sperling MR, Lüders H, Pedley TA; Commission on Neurosurgery of the International League Against Epilepsy (ILAE). ILAE Commission Report. Proposal for a new classification of outcome with respect to epileptic seizures following epilepsy surgery. Epilepsia. 2001 Feb;42(2):282-6. PMID: 11240604.",
+            "Units": "number class",
+    },
+    "fiveSenseScore": {
+        "Description": "5-SENSE Score",
+        "Reference": "Astner-Rohracher A, Zimmermann G, Avigdor T, Abdallah C, Barot N, Brázdil M, Doležalová I, Gotman J, Hall JA, Ikeda K, Kahane P, Kalss G, Kokkinos V, Leitinger M, Mindruta I, Minotti L, Mizera MM, Oane I, Richardson M, Schuele SU, Trinka E, Urban A, Whatley B, Dubeau F, Frauscher B. Development and Validation of the 5-SENSE Score to Predict Focality of the Seizure-Onset Zone as Assessed by Stereoelectroencephalography. JAMA Neurol. 2022 Jan 1;79(1):70-79. doi: 10.1001/jamaneurol.2021.4405. PMID: 34870697; PMCID: PMC8649918.",
+        "Units": "number index",
+    }
+}
+
 def createParticipantsSidecar(name):
-    participants_sidecar = ParticipantsSidecar({
-        "participant_id": {
-            "Description": "Unique participant identifier"
-        },
-        "species": {
-            "Description": "Species of the participant",
-            "Levels": {
-                "homo sapiens": "Human"
-            }
-        },
-        "population": {
-            "Description": "Adult or pediatric population classification",
-            "Levels": {
-                "adult": "adult",
-                "pediatric": "pediatric"
-            }
-        },
-        "sex": {
-            "Description": "Biological sex of the subject, collected from health record",
-            "Levels": {
-                "Female": "Female",
-                "Male": "Male"
-            }
-        },
-        "MRI_lesion": {
-            "Description": "Preimplant MRI lesion status",
-            "Levels": {
-                "lesional": "lesional",
-                "nonlesional": "nonlesional",
-                "n/a": "not available"
-            }
-        },
-        "MRI_lesionType": {
-            "Description": "Type of MRI lesion",
-            "Levels": {
-                "Encephalocele": "Encephalocele",
-                "FCD": "Focal Cortical Dysplasia",
-                "MTS": "Medial Temporal Sclerosis",
-                "Multiple": "see MRI_lesionDetails for description",
-                "Prior surgery": "prior resection",
-                "PVNH": "periventricular nodular heterotopia",
-                "Tubers": "Tubers",
-                "n/a": "nonlesional",
-                "Other": "see MRI_lesionDetails for description"
-            }
-        },
-        "MRI_lesionDetails": {
-            "Description": "Type of MRI lesion, specified",
-        },
-        "ieeg_isFocal": {
-            "Description": "Postimplant determination of seizure onset focality",
-            "Levels": {
-                "focal": "focal",
-                "nonfocal": "nonfocal"
-            }
-        },
-        "age_intervention":{
-            "Description": "Age of subject at postimplant surgical intervention",
-            "Units": "years"
-        },
-        "intervention_type": {
-            "Description": "Postimplant intervention, associated data in postsurgery session if applicable",
-            "Levels": {
-            "ablation": "laser ablation",
-            "DBS": "Deep brain stimulation device",
-            "medication": "medication management, no surgical intervention post iEEG implant",
-            "resection": "resection",
-            "RNS": "Responsive neurostimulation (NeuroPace RNS System)",
-            "VNS": "Vagal nerve stimulator device"
-            }
-        },
-        "intervention_side": {
-            "Description": "Hemisphere of surgical intervention",
-            "Levels": {
-                "Bilateral": "Bilateral",
-                "Left": "Left",
-                "Right": "Right",
-                "n/a": "no surgical intervention"
-            }
+    participants_sidecar = ParticipantsSidecar(PARTICIPANTS_SCHEMA)
+
+    participants_sidecar.save(output_dir=f"output/{name}", json_indent=4)
+
+# dataset_description.json fields shared by every dataset; only "Name" varies
+DATASET_DESCRIPTION_TEMPLATE = {
+    "BIDSVersion": "1.10.1",
+    "DatasetType": "raw",
+    "License": "CC-BY",
+    "Authors": [
+        {
+            "first_name" : "Nishant",
+            "last_name" : "Sinha",
+            "orcid" : "0000-0002-2090-4889",
+            "degree" : "Ph.D."
         },
-        "intervention_location": {
-            "Description": "Brain region of surgical intervention",
+        {
+            "first_name" : "Erin",
+            "middle_initial" : "C",
+            "last_name" : "Conrad",
+            "orcid" : "0000-0001-8910-1817",
+            "degree" : "M.D."
         },
-        "seizure_Engel12m": {
-            "Description": "Engel outcome classification 12 months post-surgical intervention; integer represents roman numeral classes and .1 = A, .2 = B, .3 = C, .4 = D",
-            "Reference": "Wieser HG, Blume WT, Fish D, Goldensohn E, Hufnagel A, King D, Sperling MR, Lüders H, Pedley TA; Commission on Neurosurgery of the International League Against Epilepsy (ILAE). ILAE Commission Report. Proposal for a new classification of outcome with respect to epileptic seizures following epilepsy surgery. Epilepsia. 2001 Feb;42(2):282-6. PMID: 11240604.",
-            "Units": "number class",
+        {
+            "first_name" : "Kathryn",
+            "middle_initial" : "A",
+            "last_name" : "Davis",
+            "orcid" : "0000-0002-7020-6480",
+            "degree" : "M.D., "
         },
-        "seizure_Engel24m": {
-                "Description": "Engel outcome classification 24 months postsurgical intervention; integer represents roman numeral classes and .1 = A, .2 = B, .3 = C, .4 = D",
-                "Reference": "Wieser HG, Blume WT, Fish D, Goldensohn E, Hufnagel A, King D, Sperling MR, Lüders H, Pedley TA; Commission on Neurosurgery of the International League Against Epilepsy (ILAE). ILAE Commission Report. Proposal for a new classification of outcome with respect to epileptic seizures following epilepsy surgery. Epilepsia. 2001 Feb;42(2):282-6. PMID: 11240604.",
-                "Units": "number class",
+        {
+            "first_name" : "Joost",
+            "middle_initial" : "B",
+            "last_name" : "Wagenaar",
+            "orcid" : "0000-0003-0837-7120",
+            "degree" : "Ph.D., "
         },
-        "fiveSenseScore": {
-            "Description": "5-SENSE Score",
-            "Reference": "Astner-Rohracher A, Zimmermann G, Avigdor T, Abdallah C, Barot N, Brázdil M, Doležalová I, Gotman J, Hall JA, Ikeda K, Kahane P, Kalss G, Kokkinos V, Leitinger M, Mindruta I, Minotti L, Mizera MM, Oane I, Richardson M, Schuele SU, Trinka E, Urban A, Whatley B, Dubeau F, Frauscher B. Development and Validation of the 5-SENSE Score to Predict Focality of the Seizure-Onset Zone as Assessed by Stereoelectroencephalography. JAMA Neurol. 2022 Jan 1;79(1):70-79. doi: 10.1001/jamaneurol.2021.4405. PMID: 34870697; PMCID: PMC8649918.",
-            "Units": "number index",
+        {
+            "first_name" : "Brian",
+            "last_name" : "Litt",
+            "orcid" : "0000-0003-2732-6927",
+            "degree" : "M.D."
         }
-    })
-
-    participants_sidecar.save(output_dir=f"output/{name}", json_indent=4)
+    ],
+    "Acknowledgements": "This dataset was prepared by the iEEG-BIDS Migration Tool developed at the University of Pennsylvania.",
+    "HowToAcknowledge": "Please cite this dataset using the information in the footer found on epilepsy.science",
+    "Funding": [
+        "National Institue of Neurological Disorders and Stroke of the National Institutes of Health K99NS138680", 
+        "National Institue of Neurological Disorders and Stroke of the National Institutes of Health K23NS121401", 
+        "National Institue of Neurological Disorders and Stroke of the National Institutes of Health R01NS125137", 
+        "National Institue of Neurological Disorders and Stroke of the National Institutes of Health R01NS116504", 
+        "National Institue of Neurological Disorders and Stroke of the National Institutes of Health U24NS134536", 
+        "National Institue of Neurological Disorders and Stroke of the National Institutes of Health U24NS063930",
+        "National Institue of Neurological Disorders and Stroke of the National Institutes of Health R61NS125568",
+        "National Institue of Neurological Disorders and Stroke of the National Institutes of Health DP1NS122038",
+        "The Burroughs Welcome Fund" 
+    ],
+    "EthicsApprovals": [
+        "University of Pennsylvania Human Research Protections Program, Institutional Review Boards (Protocol 703979, 811097, and/or 821778)"
+    ],
+    "ReferencesAndLinks": "",
+    "Keywords": ["epilepsy", "intracranial", "human", "adult", "epilepsy.science"]
+}
 
 def ceateDatasetDescription(name):
-    dd_sidecar = DatasetDescriptionSidecar({
-            "Name": f"{name}",
-            "BIDSVersion": "1.10.1",
-            "DatasetType": "raw",
-            "License": "CC-BY",
-            "Authors": [
-                {
-                    "first_name" : "Nishant",
-                    "last_name" : "Sinha",
-                    "orcid" : "0000-0002-2090-4889",
-                    "degree" : "Ph.D."
-                },
-                {
-                    "first_name" : "Erin",
-                    "middle_initial" : "C",
-                    "last_name" : "Conrad",
-                    "orcid" : "0000-0001-8910-1817",
-                    "degree" : "M.D."
-                },
-                {
-                    "first_name" : "Kathryn",
-                    "middle_initial" : "A",
-                    "last_name" : "Davis",
-                    "orcid" : "0000-0002-7020-6480",
-                    "degree" : "M.D., "
-                },
-                {
-                    "first_name" : "Joost",
-                    "middle_initial" : "B",
-                    "last_name" : "Wagenaar",
-                    "orcid" : "0000-0003-0837-7120",
-                    "degree" : "Ph.D., "
-                },
-                {
-                    "first_name" : "Brian",
-                    "last_name" : "Litt",
-                    "orcid" : "0000-0003-2732-6927",
-                    "degree" : "M.D."
-                }
-            ],
-            "Acknowledgements": "This dataset was prepared by the iEEG-BIDS Migration Tool developed at the University of Pennsylvania.",
-            "HowToAcknowledge": "Please cite this dataset using the information in the footer found on epilepsy.science",
-            "Funding": [
-                "National Institue of Neurological Disorders and Stroke of the National Institutes of Health K99NS138680", 
-                "National Institue of Neurological Disorders and Stroke of the National Institutes of Health K23NS121401", 
-                "National Institue of Neurological Disorders and Stroke of the National Institutes of Health R01NS125137", 
-                "National Institue of Neurological Disorders and Stroke of the National Institutes of Health R01NS116504", 
-                "National Institue of Neurological Disorders and Stroke of the National Institutes of Health U24NS134536", 
-                "National Institue of Neurological Disorders and Stroke of the National Institutes of Health U24NS063930",
-                "National Institue of Neurological Disorders and Stroke of the National Institutes of Health R61NS125568",
-                "National Institue of Neurological Disorders and Stroke of the National Institutes of Health DP1NS122038",
-                "The Burroughs Welcome Fund" 
-            ],
-            "EthicsApprovals": [
-                "University of Pennsylvania Human Research Protections Program, Institutional Review Boards (Protocol 703979, 811097, and/or 821778)"
-            ],
-            "ReferencesAndLinks": "",
-            "Keywords": ["epilepsy", "intracranial", "human", "adult", "epilepsy.science"]
-        })
+    dd_sidecar = DatasetDescriptionSidecar({"Name": name, **DATASET_DESCRIPTION_TEMPLATE})
 
     dd_sidecar.save(output_dir=f"output/{name}", json_indent=4)
 
-def merge_csvs_by_eps(csv_path_1: str, csv_path_2: str) -> Dict[str, Dict[str, Any]]:
+def merge_csvs_by_eps(
+    csv1_data: Dict[str, Dict[str, Any]],
+    csv2_data: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
     """
-    Merge two CSV files by the 'EPS Number' column.
+    Merge two CSV maps (as returned by read_csv_to_dict) by EPS Number.
     Each key in the result dict is an EPS Number, and its value is a merged dict
-    of all other columns from both CSVs.
+    of all other columns from both CSVs. Columns from csv2_data win on conflicts.
 
     Example output:
     {
@@ -558,22 +575,26 @@ def merge_csvs_by_eps(csv_path_1: str, csv_path_2: str) -> Dict[str, Dict[str, A
         }
     }
     """
-    path1, path2 = Path(csv_path_1), Path(csv_path_2)
-
-    csv1_data = read_csv_to_dict(path1)
-    csv2_data = read_csv_to_dict(path2)
-
-    merged = {}
-
-    # Combine both datasets by EPS Number
-    all_eps = set(csv1_data.keys()) | set(csv2_data.keys())
-
-    for eps in all_eps:
-        merged[eps] = {}
-        merged[eps].update(csv1_data.get(eps, {}))
-        merged[eps].update(csv2_data.get(eps, {}))
+    return {
+        eps: {**csv1_data.get(eps, {}), **csv2_data.get(eps, {})}
+        for eps in csv1_data.keys() | csv2_data.keys()
+    }
 
-    return merged
+def process_dataset(penn_epi_name, migration_hardware_data_map, migration_subject_map):
+    """Write every sidecar for one dataset (each dataset has its own output directory)."""
+    print(f"[{penn_epi_name}] Processing dataset")
+    eps_name = penn_epi_to_eps(penn_epi_name)
+
+    ceateDatasetDescription(penn_epi_name)
+    createParticipantsSidecar(penn_epi_name)
+    createParticipantsTSVSidecar(penn_epi_name,eps_name,migration_subject_map)
+    createSessionsDataSidecar(penn_epi_name,eps_name,migration_subject_map)
+    createIEEGDataSidecar(penn_epi_name,eps_name,migration_hardware_data_map)
+    created_electrodes = createElectrodesSidecar(penn_epi_name)
+    if created_electrodes:
+        print(f"[{penn_epi_name}] Was electrodes created: {created_electrodes}")
+    if created_electrodes:
+        createCoordsSidecar(penn_epi_name)
 
 def main():
 
@@ -582,46 +603,35 @@ def main():
         print("Fetching channels")
         make_channels()
 
-    print("Fetching all datasets...")
-    datasets = get_all_datasets()
-    print(f"Total datasets fetched: {len(datasets)}")
+    # Keep only the datasets named in DATASET_RUN, and report any that don't exist
+    print("Fetching datasets...")
+    dataset_run = set(DATASET_RUN)
+    datasets = [
+        ds for ds in get_all_datasets()
+        if (ds.get("content") or {}).get("name") in dataset_run
+    ]
+    found = {ds["content"]["name"] for ds in datasets}
+    for name in DATASET_RUN:
+        if name not in found:
+            print(f"Skipping {name}: dataset not found")
+    print(f"Datasets to process: {len(datasets)}")
     
     migration_hardware_data_map = multi_dataset_read_csv_to_dict(Path(MASTER_MIGRATION_METADATA))
     migration_subject_map = read_csv_to_dict(Path(MASTER_SUBJECT_METADATA))
 
-    for ds in datasets:
-        original_name = ds["content"]["name"]
-        
+    names_to_run = [ds["content"]["name"] for ds in datasets]
 
-        if not original_name.startswith("PennEPI"):
-            continue
-
-        penn_epi_name = original_name
-        print(f"\nProcessing dataset: {penn_epi_name}")
-        if penn_epi_name not in DATASET_RUN:
-            print(f"Skipping dataset: {penn_epi_name}")
-            continue
-        eps_name = penn_epi_to_eps(original_name)
-
-        ceateDatasetDescription(penn_epi_name)
-        createParticipantsSidecar(penn_epi_name)
-        createParticipantsTSVSidecar(penn_epi_name,eps_name,migration_subject_map)
-        createSessionsDataSidecar(penn_epi_name,eps_name,migration_subject_map)
-        createIEEGDataSidecar(penn_epi_name,eps_name,migration_hardware_data_map)
-        created_electrodes = createElectrodesSidecar(penn_epi_name)
-        if created_electrodes:
-            print(f"{penn_epi_name} Was electrodes created: {created_electrodes}")
-        if created_electrodes:
-            createCoordsSidecar(penn_epi_name)
-        
+    # Datasets write to separate directories, so they can be generated side by side
+    def process_one(penn_epi_name):
+        process_dataset(penn_epi_name, migration_hardware_data_map, migration_subject_map)
 
-def rename(name):
-    digits = ''.join(c for c in name if c.isdigit())
-    number = str(int(digits))
-    padded = number.zfill(5)
-    new_name = f"{PREFIX}{padded}"
+    with ThreadPoolExecutor(max_workers=MAX_DATASET_WORKERS) as executor:
+        list(executor.map(process_one, names_to_run))
 
-    return new_name
+
+def rename(name):
+    digits = _NON_DIGITS_RE.sub("", name)
+    return f"{PREFIX}{int(digits):05d}"
 
 
 if __name__ == "__main__":
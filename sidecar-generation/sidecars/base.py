@@ -3,20 +3,36 @@ import sys
 import csv
 import json
 import logging
+import operator
 import threading
 
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Tuple, List
+from typing import TYPE_CHECKING, Dict, Any, Callable, Optional, Set, Tuple, List
+
+# jsonschema is slow to import and TSV-only runs never need it, so it is
+# loaded on first use
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+
+try:
+    import fastjsonschema
+except ImportError:  # optional, jsonschema alone is used without it
+    fastjsonschema = None
 
 # Add parent directories to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from shared.config import ensure_dir
 from shared.logger import setup_logger
 
 
 _logger_lock = threading.Lock()
 
+# Output directories already created by this process, so repeated saves into
+# a subject's directories skip the makedirs stat chain
+_ENSURED_DIRS: Set[str] = set()
+
 
 class Sidecar(ABC):
     """
@@ -40,11 +56,20 @@ class Sidecar(ABC):
 
     json_indent: int = 4
 
-    REQUIRED_FIELDS = {}
-    RECOMMENDED_FIELDS = {}
-    OPTIONAL_FIELDS = {}
+    REQUIRED_FIELDS = frozenset()
+    RECOMMENDED_FIELDS = frozenset()
+    OPTIONAL_FIELDS = frozenset()
     SCHEMA = {}
 
+    # REQUIRED | RECOMMENDED | OPTIONAL, frozen per subclass by __init_subclass__
+    _KNOWN_FIELDS = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._KNOWN_FIELDS = frozenset().union(
+            cls.REQUIRED_FIELDS, cls.RECOMMENDED_FIELDS, cls.OPTIONAL_FIELDS
+        )
+
 
     @classmethod
     def configure_logger(cls, log_dir: str):
@@ -63,6 +88,10 @@ class Sidecar(ABC):
 
     @classmethod
     def get_logger(cls):
+        # Read once without the lock; it's only taken while the logger is unset
+        logger = cls._logger
+        if logger is not None:
+            return logger
         with _logger_lock:
             if cls._logger is None:
                 cls._logger = setup_logger("sidecar_data_generator", log_dir=cls._log_dir)
@@ -162,7 +191,7 @@ class Sidecar(ABC):
         output_dir = kwargs.get("output_dir", None) or "output/json"
         filename = self.filename
         file_path = os.path.join(output_dir, filename)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        self._ensure_output_dir(os.path.dirname(file_path))
 
         # Actual writing handled by subclass or format writer
         self.write_data(file_path, data)
@@ -170,16 +199,24 @@ class Sidecar(ABC):
         self.log.info(f"Saved {self.__class__.__name__} to {file_path}")
         return file_path
 
+    @staticmethod
+    def _ensure_output_dir(path: str) -> None:
+        """Create an output directory the first time this process writes to it."""
+        if path not in _ENSURED_DIRS:
+            ensure_dir(path)
+            _ENSURED_DIRS.add(path)
+
     def write_data(self, file_path: str, data: Dict[str, Any]):
-        """Default JSON writer."""
+        """Default JSON writer. Encodes in one pass and writes the text at once."""
+        content = json.dumps(data, indent=self.json_indent, default=str)
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=self.json_indent, default=str)
+            f.write(content)
 
     def __repr__(self):
         return f"<{self.__class__.__name__} fields={len(self.data)} paths={self.paths}>"
 
     def __str__(self):
-        return json.dumps(self.data, indent=2)
+        return json.dumps(self.data, indent=2, default=str)
 
     def show_field_summary(self, log=False):
         summary = (
@@ -202,10 +239,71 @@ class JSONSidecar(Sidecar):
 
     file_format = "json"
 
-    def write_data(self, file_path: str, data: Dict[str, Any]):
-        """Default JSON writer."""
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=self.json_indent, default=str)
+    @classmethod
+    def get_validator(cls) -> "Draft202012Validator":
+        """
+        Return a validator for cls.SCHEMA, built and schema-checked once per class.
+
+        The validator is stored on the class itself (looked up via cls.__dict__)
+        so subclasses with their own SCHEMA never pick up a parent's validator.
+        """
+        validator = cls.__dict__.get("_validator")
+        if validator is None:
+            from jsonschema import Draft202012Validator
+
+            Draft202012Validator.check_schema(cls.SCHEMA)
+            validator = cls._validator = Draft202012Validator(cls.SCHEMA)
+        return validator
+
+    @classmethod
+    def get_compiled_check(cls) -> Optional[Callable[[Any], Any]]:
+        """
+        Return a fastjsonschema check generated from cls.SCHEMA, or None when
+        fastjsonschema isn't installed. Compiled once per class, like
+        get_validator(). Defaults are not applied, so data is never modified.
+
+        fastjsonschema has no draft 2020-12 support and reads SCHEMA as
+        draft-07, so schemas should stick to keywords both drafts share.
+        """
+        if fastjsonschema is None:
+            return None
+        check = cls.__dict__.get("_compiled_check")
+        if check is None:
+            check = cls._compiled_check = fastjsonschema.compile(cls.SCHEMA, use_default=False)
+        return check
+
+    def schema_errors(self, data: Optional[Dict[str, Any]] = None) -> list:
+        """
+        Return the jsonschema errors for data (default self.data), sorted by path.
+
+        The generated check runs first when available and valid data returns
+        straight away. fastjsonschema stops at the first error, so invalid
+        data is still walked by jsonschema to report every error.
+        """
+        if data is None:
+            data = self.data
+        check = self.get_compiled_check()
+        if check is not None:
+            try:
+                check(data)
+                return []
+            except fastjsonschema.JsonSchemaException:
+                pass
+        return sorted(self.get_validator().iter_errors(data), key=operator.attrgetter("path"))
+
+    def save(self, **kwargs) -> str:
+        """
+        Save the sidecar. With validate=True the data being written is
+        checked against SCHEMA first and errors are logged, as for the TSV
+        sidecars; the file is written either way.
+        """
+        if kwargs.pop("validate", False):
+            errors = self.schema_errors(kwargs.get("data"))
+            for err in errors:
+                self.log.error(f"Schema error at {list(err.path)}: {err.message}")
+            if errors:
+                self.log.warning(f"Validation failed with {len(errors)} errors")
+        return super().save(**kwargs)
 
 
 class TSVSidecar(Sidecar):
@@ -213,6 +311,9 @@ class TSVSidecar(Sidecar):
 
     file_format = "tsv"
 
+    # Values for columns a row leaves out; set per subclass
+    ROW_DEFAULTS: Dict[str, Any] = {}
+
     def __init__(self, fields={}, required_fields=None, recommended_fields=None, optional_fields=None, schema=None, **kwargs):
         super().__init__(fields, required_fields, recommended_fields, optional_fields, schema, **kwargs)
 
@@ -220,6 +321,17 @@ class TSVSidecar(Sidecar):
     def delimiter(self):
         return "\t"
 
+    def _with_defaults(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge a row with ROW_DEFAULTS.
+
+        Rows that already set every default column are used as-is rather
+        than copied, since the merge would produce an identical row.
+        """
+        if self.ROW_DEFAULTS.keys() <= row.keys():
+            return row
+        return {**self.ROW_DEFAULTS, **row}
+
     def write_data(self, file_path: str, data: List[Dict[str, Any]]):
         """
         Writes a TSV file. Each dict represents a row.
@@ -230,9 +342,26 @@ class TSVSidecar(Sidecar):
         fieldnames = list(data[0].keys())
 
         with open(file_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter="\t")
-            writer.writeheader()
-            writer.writerows(data)
+            self.write_rows(f, fieldnames, data)
 
         self.log.debug(f"Wrote TSV data to {file_path}")
 
+    def write_rows(self, f, fieldnames: List[str], rows: List[Dict[str, Any]]):
+        """
+        Write a header and rows to an open file.
+
+        When every row has exactly the header's columns, values are pulled
+        with one itemgetter and written by csv.writer in a single batch,
+        skipping DictWriter's per-row key checks. Anything else goes through
+        DictWriter, so missing columns are blank and extra columns raise.
+        """
+        columns = set(fieldnames)
+        if len(fieldnames) > 1 and all(row.keys() == columns for row in rows):
+            writer = csv.writer(f, delimiter=self.delimiter)
+            writer.writerow(fieldnames)
+            writer.writerows(map(operator.itemgetter(*fieldnames), rows))
+        else:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=self.delimiter)
+            writer.writeheader()
+            writer.writerows(rows)
+
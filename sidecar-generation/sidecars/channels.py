@@ -16,7 +16,7 @@ class ChannelsSidecar(TSVSidecar):
     file_format = "tsv"
 
     # Field definitions based on BIDS iEEG specification
-    REQUIRED_FIELDS = {
+    REQUIRED_FIELDS = frozenset({
         "name",
         "type",
         "units",
@@ -26,12 +26,12 @@ class ChannelsSidecar(TSVSidecar):
         "notch",
         "reference",
         "group",
-    }
+    })
 
-    RECOMMENDED_FIELDS = {"ground"}
-    OPTIONAL_FIELDS = {
+    RECOMMENDED_FIELDS = frozenset({"ground"})
+    OPTIONAL_FIELDS = frozenset({
         "description",  # free text column for optional notes
-    }
+    })
 
     # Default values for channel rows - user data overrides these
     ROW_DEFAULTS = {
@@ -68,8 +68,7 @@ class ChannelsSidecar(TSVSidecar):
         self.rows = []
         if rows:
             for row in rows:
-                merged_row = {**self.ROW_DEFAULTS, **row}
-                self.rows.append(merged_row)
+                self.rows.append(self._with_defaults(row))
 
         self.log.debug(
             f"{self.__class__.__name__} initialized with {len(self.rows)} rows "
@@ -78,8 +77,7 @@ class ChannelsSidecar(TSVSidecar):
 
     def add_row(self, row: Dict[str, Any]) -> None:
         """Add a single channel row, merging with defaults."""
-        merged_row = {**self.ROW_DEFAULTS, **row}
-        self.rows.append(merged_row)
+        self.rows.append(self._with_defaults(row))
 
     def validate(self, data: List[Dict[str, Any]] = None) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -102,13 +100,12 @@ class ChannelsSidecar(TSVSidecar):
         if not isinstance(data, list) or not data:
             return False, {"errors": ["Data must be a non-empty list of dictionaries."]}
 
-        all_fields = set().union(*(row.keys() for row in data))
+        # Iterating a row yields its keys
+        all_fields = set().union(*data)
 
         # Field presence validation
         missing_required = self.REQUIRED_FIELDS - all_fields
-        extra_fields = all_fields - (
-            self.REQUIRED_FIELDS | self.RECOMMENDED_FIELDS | self.OPTIONAL_FIELDS
-        )
+        extra_fields = all_fields - self._KNOWN_FIELDS
 
         if missing_required:
             errors.append(f"Missing REQUIRED fields: {sorted(missing_required)}")
@@ -118,15 +115,19 @@ class ChannelsSidecar(TSVSidecar):
 
         # Consistency check — all rows have same fields
         for i, row in enumerate(data):
-            if set(row.keys()) != all_fields:
+            if row.keys() != all_fields:
                 warnings.append(f"Row {i+1} has inconsistent columns")
 
-        # Check numeric fields for proper format
-        numeric_fields = ["low_cutoff", "high_cutoff", "sampling_frequency", "notch"]
+        # Check numeric fields for proper format; a column no row has can't
+        # hold a bad value, and int/float cells need no float() round trip
+        numeric_fields = [
+            f for f in ("low_cutoff", "high_cutoff", "sampling_frequency", "notch")
+            if f in all_fields
+        ]
         for field in numeric_fields:
             for i, row in enumerate(data):
                 val = row.get(field, None)
-                if val not in (None, "n/a", "N/A"):
+                if type(val) not in (int, float) and val not in (None, "n/a", "N/A"):
                     try:
                         float(val)
                     except (TypeError, ValueError):
@@ -147,7 +148,6 @@ class ChannelsSidecar(TSVSidecar):
             Path to the saved file.
         """
         import os
-        import csv
 
         data = kwargs.get("data", self.rows)
 
@@ -163,20 +163,18 @@ class ChannelsSidecar(TSVSidecar):
             output_dir = kwargs.get("output_dir", "output/tsv")
             output_path = os.path.join(output_dir, self.filename)
 
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        self._ensure_output_dir(os.path.dirname(output_path))
 
         # Use COLUMN_ORDER for consistent output, adding any extra columns at the end
         if data:
-            all_cols = set().union(*(row.keys() for row in data))
+            all_cols = set().union(*data)
             extra_cols = sorted(all_cols - set(self.COLUMN_ORDER))
             fieldnames = [c for c in self.COLUMN_ORDER if c in all_cols] + extra_cols
         else:
             fieldnames = self.COLUMN_ORDER
 
         with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter="\t")
-            writer.writeheader()
-            writer.writerows(data)
+            self.write_rows(f, fieldnames, data)
 
         self.log.info(f"Saved {self.__class__.__name__} ({len(data)} rows) to {output_path}")
         return output_path
@@ -1,4 +1,3 @@
-from jsonschema import Draft202012Validator
 from typing import Dict, Any
 from .base import JSONSidecar
 
@@ -16,20 +15,20 @@ class CoordSystemSidecar(JSONSidecar):
     filename = "coordsystem.json"
     bids_path = "bids_root/"
 
-    REQUIRED_FIELDS = {
+    REQUIRED_FIELDS = frozenset({
         "iEEGCoordinateSystem",
         "iEEGCoordinateUnits",
-    }
+    })
 
-    RECOMMENDED_FIELDS = {
+    RECOMMENDED_FIELDS = frozenset({
         "iEEGCoordinateSystemDescription",
         "iEEGCoordinateProcessingDescription",
         "iEEGCoordinateProcessingReference",
-    }
+    })
 
-    OPTIONAL_FIELDS = {
+    OPTIONAL_FIELDS = frozenset({
         "IntendedFor",
-    }
+    })
 
     DEFAULTS = {
         "iEEGCoordinateSystem": "fsnative",
@@ -74,8 +73,7 @@ class CoordSystemSidecar(JSONSidecar):
         """
         Validate the coord system JSON file against schema and BIDS field logic.
         """
-        validator = Draft202012Validator(self.SCHEMA)
-        errors = sorted(validator.iter_errors(self.data), key=lambda e: e.path)
+        errors = self.schema_errors()
 
         if errors:
             for err in errors:
@@ -84,9 +82,7 @@ class CoordSystemSidecar(JSONSidecar):
 
         missing_required = self.REQUIRED_FIELDS - self.data.keys()
         missing_recommended = self.RECOMMENDED_FIELDS - self.data.keys()
-        extras = set(self.data.keys()) - (
-            self.REQUIRED_FIELDS | self.RECOMMENDED_FIELDS | self.OPTIONAL_FIELDS
-        )
+        extras = self.data.keys() - self._KNOWN_FIELDS
 
         # Special case: if iEEGCoordinateSystem == "Other", description is required
         if (
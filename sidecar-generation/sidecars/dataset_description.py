@@ -1,4 +1,3 @@
-from jsonschema import Draft202012Validator
 from typing import Dict, Any
 from .base import JSONSidecar
 
@@ -16,9 +15,9 @@ class DatasetDescriptionSidecar(JSONSidecar):
     filename = "dataset_description.json"
     bids_path = "bids_root/"
 
-    REQUIRED_FIELDS = {"Name", "BIDSVersion"}
-    RECOMMENDED_FIELDS = {"HEDVersion", "DatasetType", "License", "Authors"}
-    OPTIONAL_FIELDS = {
+    REQUIRED_FIELDS = frozenset({"Name", "BIDSVersion"})
+    RECOMMENDED_FIELDS = frozenset({"HEDVersion", "DatasetType", "License", "Authors"})
+    OPTIONAL_FIELDS = frozenset({
         "Keywords",
         "Acknowledgements",
         "HowToAcknowledge",
@@ -27,7 +26,7 @@ class DatasetDescriptionSidecar(JSONSidecar):
         "ReferencesAndLinks",
         "DatasetDOI",
         "GeneratedBy",
-    }
+    })
 
     DEFAULTS = {
         "Name": "Unnamed Dataset",
@@ -77,8 +76,7 @@ class DatasetDescriptionSidecar(JSONSidecar):
         )
 
     def validate(self):
-        validator = Draft202012Validator(self.SCHEMA)
-        errors = sorted(validator.iter_errors(self.data), key=lambda e: e.path)
+        errors = self.schema_errors()
         if errors:
             print(errors)
             for err in errors:
@@ -87,9 +85,7 @@ class DatasetDescriptionSidecar(JSONSidecar):
 
         missing_required = self.REQUIRED_FIELDS - self.data.keys()
         missing_recommended = self.RECOMMENDED_FIELDS - self.data.keys()
-        extras = set(self.data.keys()) - (
-            self.REQUIRED_FIELDS | self.RECOMMENDED_FIELDS | self.OPTIONAL_FIELDS
-        )
+        extras = self.data.keys() - self._KNOWN_FIELDS
 
         if missing_required:
             raise ValueError(f"Missing REQUIRED fields: {sorted(missing_required)}")
@@ -1,4 +1,3 @@
-from jsonschema import Draft202012Validator
 from typing import Dict, Any
 from .base import JSONSidecar
 
@@ -15,15 +14,15 @@ class EEGSidecar(JSONSidecar):
     filename = "eeg.json"
     bids_path = "bids_root/"
 
-    REQUIRED_FIELDS = {
+    REQUIRED_FIELDS = frozenset({
         "TaskName",
         "EEGReference",
         "SamplingFrequency",
         "PowerLineFrequency",
         "SoftwareFilters",
-    }
+    })
 
-    RECOMMENDED_FIELDS = {
+    RECOMMENDED_FIELDS = frozenset({
         "TaskDescription",
         "Instructions",
         "CogAtlasID",
@@ -50,13 +49,13 @@ class EEGSidecar(JSONSidecar):
         "EEGPlacementScheme",
         "HardwareFilters",
         "SubjectArtefactDescription",
-    }
+    })
 
-    OPTIONAL_FIELDS = {
+    OPTIONAL_FIELDS = frozenset({
         "EpochLength",
         "ElectricalStimulation",
         "ElectricalStimulationParameters",
-    }
+    })
 
     DEFAULTS = {
         "TaskName": "default_task",
@@ -145,8 +144,7 @@ class EEGSidecar(JSONSidecar):
         )
 
     def validate(self):
-        validator = Draft202012Validator(self.SCHEMA)
-        errors = sorted(validator.iter_errors(self.data), key=lambda e: e.path)
+        errors = self.schema_errors()
         if errors:
             for err in errors:
                 self.log.error(f"Schema error at {list(err.path)}: {err.message}")
@@ -154,9 +152,7 @@ class EEGSidecar(JSONSidecar):
 
         missing_required = self.REQUIRED_FIELDS - self.data.keys()
         missing_recommended = self.RECOMMENDED_FIELDS - self.data.keys()
-        extras = set(self.data.keys()) - (
-            self.REQUIRED_FIELDS | self.RECOMMENDED_FIELDS | self.OPTIONAL_FIELDS
-        )
+        extras = self.data.keys() - self._KNOWN_FIELDS
 
         # Rule: if RecordingType == "epoched", EpochLength becomes required
         if (
@@ -14,9 +14,9 @@ class ElectrodesSidecar(TSVSidecar):
     filename = "electrodes.tsv"
     file_format = "tsv"
 
-    REQUIRED_FIELDS = {"name", "x", "y", "z", "size"}
-    RECOMMENDED_FIELDS = {"material", "manufacturer", "group", "hemisphere"}
-    OPTIONAL_FIELDS = {"type", "impedance", "dimension", "roi"}
+    REQUIRED_FIELDS = frozenset({"name", "x", "y", "z", "size"})
+    RECOMMENDED_FIELDS = frozenset({"material", "manufacturer", "group", "hemisphere"})
+    OPTIONAL_FIELDS = frozenset({"type", "impedance", "dimension", "roi"})
 
     # Default values for electrode rows - user data overrides these
     ROW_DEFAULTS = {
@@ -41,8 +41,7 @@ class ElectrodesSidecar(TSVSidecar):
         self.rows = []
         if rows:
             for row in rows:
-                merged_row = {**self.ROW_DEFAULTS, **row}
-                self.rows.append(merged_row)
+                self.rows.append(self._with_defaults(row))
 
         self.log.debug(
             f"{self.__class__.__name__} initialized with {len(self.rows)} rows"
@@ -50,8 +49,7 @@ class ElectrodesSidecar(TSVSidecar):
 
     def add_row(self, row: Dict[str, Any]) -> None:
         """Add a single electrode row, merging with defaults."""
-        merged_row = {**self.ROW_DEFAULTS, **row}
-        self.rows.append(merged_row)
+        self.rows.append(self._with_defaults(row))
 
     def validate(self, data: List[Dict[str, Any]] = None) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -74,15 +72,13 @@ class ElectrodesSidecar(TSVSidecar):
         if not isinstance(data, list) or not data:
             return False, {"errors": ["Data must be a non-empty list of dictionaries."]}
 
-        # Gather all columns found in the data
-        all_fields = set().union(*(row.keys() for row in data))
+        # Gather all columns found in the data (iterating a row yields its keys)
+        all_fields = set().union(*data)
 
         # Field-level presence validation
         missing_required = self.REQUIRED_FIELDS - all_fields
         missing_recommended = self.RECOMMENDED_FIELDS - all_fields
-        extra_fields = all_fields - (
-            self.REQUIRED_FIELDS | self.RECOMMENDED_FIELDS | self.OPTIONAL_FIELDS
-        )
+        extra_fields = all_fields - self._KNOWN_FIELDS
 
         if missing_required:
             errors.append(f"Missing REQUIRED fields: {sorted(missing_required)}")
@@ -93,15 +89,16 @@ class ElectrodesSidecar(TSVSidecar):
 
         # Consistency: all rows have same keys
         for i, row in enumerate(data):
-            if set(row.keys()) != all_fields:
+            if row.keys() != all_fields:
                 warnings.append(f"Row {i+1} has inconsistent columns")
 
-        # Check numeric fields
-        numeric_fields = ["x", "y", "z", "size", "impedance"]
+        # Check numeric fields; a column no row has can't hold a bad value,
+        # and int/float cells are numeric without a float() round trip
+        numeric_fields = [f for f in ("x", "y", "z", "size", "impedance") if f in all_fields]
         for i, row in enumerate(data):
             for field in numeric_fields:
                 val = row.get(field)
-                if val not in (None, "n/a", "N/A"):
+                if type(val) not in (int, float) and val not in (None, "n/a", "N/A"):
                     try:
                         float(val)
                     except (TypeError, ValueError):
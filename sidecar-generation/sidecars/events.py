@@ -14,9 +14,9 @@ class EventsSidecar(TSVSidecar):
     filename = "events.tsv"
     file_format = "tsv"
 
-    REQUIRED_FIELDS = {"onset", "duration"}
-    RECOMMENDED_FIELDS = set()  # none defined explicitly in BIDS
-    OPTIONAL_FIELDS = {
+    REQUIRED_FIELDS = frozenset({"onset", "duration"})
+    RECOMMENDED_FIELDS = frozenset()  # none defined explicitly in BIDS
+    OPTIONAL_FIELDS = frozenset({
         "trial_type",
         "response_time",
         "HED",
@@ -28,7 +28,7 @@ class EventsSidecar(TSVSidecar):
         "Annotator",
         "Type",
         "Layer",
-    }
+    })
 
     # Default values for event rows - user data overrides these
     ROW_DEFAULTS = {
@@ -50,8 +50,7 @@ class EventsSidecar(TSVSidecar):
         self.rows = []
         if rows:
             for row in rows:
-                merged_row = {**self.ROW_DEFAULTS, **row}
-                self.rows.append(merged_row)
+                self.rows.append(self._with_defaults(row))
 
         self.log.debug(
             f"{self.__class__.__name__} initialized with {len(self.rows)} rows"
@@ -59,8 +58,7 @@ class EventsSidecar(TSVSidecar):
 
     def add_row(self, row: Dict[str, Any]) -> None:
         """Add a single event row, merging with defaults."""
-        merged_row = {**self.ROW_DEFAULTS, **row}
-        self.rows.append(merged_row)
+        self.rows.append(self._with_defaults(row))
 
     def validate(self, data: List[Dict[str, Any]] = None) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -81,31 +79,28 @@ class EventsSidecar(TSVSidecar):
         if not isinstance(data, list) or not data:
             return False, {"errors": ["Data must be a non-empty list of dictionaries."]}
 
-        # Gather all columns found in the data
-        all_fields = set().union(*(row.keys() for row in data))
+        # Gather all columns found in the data (iterating a row yields its keys)
+        all_fields = set().union(*data)
 
         # Presence checks
         missing_required = self.REQUIRED_FIELDS - all_fields
-        extra_fields = all_fields - (
-            self.REQUIRED_FIELDS | self.RECOMMENDED_FIELDS | self.OPTIONAL_FIELDS
-        )
+        extra_fields = all_fields - self._KNOWN_FIELDS
 
         if missing_required:
             errors.append(f"Missing REQUIRED fields: {sorted(missing_required)}")
         if extra_fields:
             warnings.append(f"Extra (non-BIDS) fields detected: {sorted(extra_fields)}")
 
-        # Consistency checks
+        # Consistency and numeric checks in one pass over the rows; numeric
+        # columns no row has are skipped, and int/float cells need no float()
+        numeric_fields = [f for f in ("onset", "duration", "response_time") if f in all_fields]
         for i, row in enumerate(data):
-            if set(row.keys()) != all_fields:
+            if row.keys() != all_fields:
                 warnings.append(f"Row {i+1} has inconsistent columns")
 
-        # Numeric validation
-        numeric_fields = ["onset", "duration", "response_time"]
-        for i, row in enumerate(data):
             for field in numeric_fields:
                 val = row.get(field)
-                if val not in (None, "n/a", "N/A"):
+                if type(val) not in (int, float) and val not in (None, "n/a", "N/A"):
                     try:
                         float(val)
                     except (TypeError, ValueError):
@@ -1,4 +1,3 @@
-from jsonschema import Draft202012Validator
 from typing import Dict, Any
 from .base import JSONSidecar
 
@@ -16,15 +15,15 @@ class IeegSidecar(JSONSidecar):
     filename = "ieegx.json"
     bids_path = "bids_root/"
 
-    REQUIRED_FIELDS = {
+    REQUIRED_FIELDS = frozenset({
         "TaskName",
         "PowerLineFrequency",
         "SamplingFrequency",
         "SoftwareFilters",
         "iEEGReference",
-    }
+    })
 
-    RECOMMENDED_FIELDS = {
+    RECOMMENDED_FIELDS = frozenset({
         "Manufacturer",
         "ManufacturersModelName",
         "SoftwareVersions",
@@ -54,12 +53,12 @@ class IeegSidecar(JSONSidecar):
         "InstitutionName",
         "InstitutionAddress",
         "InstitutionalDepartmentName",
-    }
+    })
 
-    OPTIONAL_FIELDS = {
+    OPTIONAL_FIELDS = frozenset({
         "ElectricalStimulation",
         "ElectricalStimulationParameters",
-    }
+    })
 
     DEFAULTS = {
         "TaskName": "clinical",
@@ -117,8 +116,7 @@ class IeegSidecar(JSONSidecar):
         Validates the iEEG sidecar JSON structure.
         Combines JSON Schema validation with BIDS-specific field checks.
         """
-        validator = Draft202012Validator(self.SCHEMA)
-        errors = sorted(validator.iter_errors(self.data), key=lambda e: e.path)
+        errors = self.schema_errors()
 
         if errors:
             for err in errors:
@@ -127,9 +125,7 @@ class IeegSidecar(JSONSidecar):
 
         missing_required = self.REQUIRED_FIELDS - self.data.keys()
         missing_recommended = self.RECOMMENDED_FIELDS - self.data.keys()
-        extras = set(self.data.keys()) - (
-            self.REQUIRED_FIELDS | self.RECOMMENDED_FIELDS | self.OPTIONAL_FIELDS
-        )
+        extras = self.data.keys() - self._KNOWN_FIELDS
 
         if missing_required:
             raise ValueError(f"Missing REQUIRED fields: {sorted(missing_required)}")
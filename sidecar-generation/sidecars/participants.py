@@ -1,4 +1,3 @@
-from jsonschema import Draft202012Validator
 from typing import Dict, Any
 from .base import JSONSidecar
 
@@ -15,16 +14,16 @@ class ParticipantsSidecar(JSONSidecar):
     filename = "participants.json"
     bids_path = "bids_root/"
 
-    REQUIRED_FIELDS = {"participant_id"}
-    RECOMMENDED_FIELDS = {
+    REQUIRED_FIELDS = frozenset({"participant_id"})
+    RECOMMENDED_FIELDS = frozenset({
         "species",
         "age",
         "sex",
         "handedness",
         "strain",
         "strain_rrid",
-    }
-    OPTIONAL_FIELDS = {"HED"}  # plus any other user-supplied columns
+    })
+    OPTIONAL_FIELDS = frozenset({"HED"})  # plus any other user-supplied columns
 
     # Default field templates based on BIDS spec
     DEFAULTS = {
@@ -82,8 +81,7 @@ class ParticipantsSidecar(JSONSidecar):
 
     def validate(self):
         """Validate JSON structure and required/recommended fields."""
-        validator = Draft202012Validator(self.SCHEMA)
-        errors = sorted(validator.iter_errors(self.data), key=lambda e: e.path)
+        errors = self.schema_errors()
 
         if errors:
             for err in errors:
@@ -93,9 +91,7 @@ class ParticipantsSidecar(JSONSidecar):
         # Logical BIDS-level checks
         missing_required = self.REQUIRED_FIELDS - self.data.keys()
         missing_recommended = self.RECOMMENDED_FIELDS - self.data.keys()
-        extras = set(self.data.keys()) - (
-            self.REQUIRED_FIELDS | self.RECOMMENDED_FIELDS | self.OPTIONAL_FIELDS
-        )
+        extras = self.data.keys() - self._KNOWN_FIELDS
 
         if missing_required:
             raise ValueError(f"Missing REQUIRED fields: {sorted(missing_required)}")
@@ -14,9 +14,9 @@ class SessionSidecar(TSVSidecar):
     filename = "sessions.tsv"
     file_format = "tsv"
 
-    REQUIRED_FIELDS = {"session_id"}
-    RECOMMENDED_FIELDS = {"acq_time", "session_description"}
-    OPTIONAL_FIELDS = {"task", "age", "sex"}
+    REQUIRED_FIELDS = frozenset({"session_id"})
+    RECOMMENDED_FIELDS = frozenset({"acq_time", "session_description"})
+    OPTIONAL_FIELDS = frozenset({"task", "age", "sex"})
 
     # Default values for session rows - user data overrides these
     ROW_DEFAULTS = {
@@ -38,8 +38,7 @@ class SessionSidecar(TSVSidecar):
         self.rows = []
         if rows:
             for row in rows:
-                merged_row = {**self.ROW_DEFAULTS, **row}
-                self.rows.append(merged_row)
+                self.rows.append(self._with_defaults(row))
 
         self.log.debug(
             f"{self.__class__.__name__} initialized with {len(self.rows)} rows"
@@ -47,8 +46,7 @@ class SessionSidecar(TSVSidecar):
 
     def add_row(self, row: Dict[str, Any]) -> None:
         """Add a single session row, merging with defaults."""
-        merged_row = {**self.ROW_DEFAULTS, **row}
-        self.rows.append(merged_row)
+        self.rows.append(self._with_defaults(row))
 
     def validate(self, data: List[Dict[str, Any]] = None) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -70,15 +68,13 @@ class SessionSidecar(TSVSidecar):
         if not isinstance(data, list) or not data:
             return False, {"errors": ["Data must be a non-empty list of dictionaries."]}
 
-        # Gather all columns found in the data
-        all_fields = set().union(*(row.keys() for row in data))
+        # Gather all columns found in the data (iterating a row yields its keys)
+        all_fields = set().union(*data)
 
         # Validation checks
         missing_required = self.REQUIRED_FIELDS - all_fields
         missing_recommended = self.RECOMMENDED_FIELDS - all_fields
-        extra_fields = all_fields - (
-            self.REQUIRED_FIELDS | self.RECOMMENDED_FIELDS | self.OPTIONAL_FIELDS
-        )
+        extra_fields = all_fields - self._KNOWN_FIELDS
 
         if missing_required:
             errors.append(f"Missing REQUIRED fields: {sorted(missing_required)}")
@@ -92,7 +88,7 @@ class SessionSidecar(TSVSidecar):
         # Ensure all rows have the same keys
         expected_cols = list(all_fields)
         for i, row in enumerate(data):
-            if set(row.keys()) != all_fields:
+            if row.keys() != all_fields:
                 warnings.append(f"Row {i+1} has inconsistent columns")
 
         ok = not errors